@@ -1,6 +1,10 @@
 import asyncio
+from contextlib import suppress
 
+from .asyncio.connector import AsyncConnector
 from .cli import main
 
 if __name__ == "__main__":
+  with suppress(ImportError):
+    AsyncConnector.install_uvloop()
   asyncio.run(main())
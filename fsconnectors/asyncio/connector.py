@@ -1,14 +1,23 @@
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterable
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
-from typing import Any
+from typing import Any, Optional
 
 from fsconnectors.utils.entry import FSEntry
 
+try:
+    import uvloop
+    _UVLOOP = True
+except ImportError:
+    _UVLOOP = False
+
 
 class AsyncConnector(ABC):
     """Abstract class for async connector."""
 
+    __slots__ = ()
+
     @asynccontextmanager
     async def connect(self) -> AsyncGenerator['AsyncConnector', None]:
         """Connects to file system.
@@ -20,6 +29,22 @@ class AsyncConnector(ABC):
         """
         yield self
 
+    @classmethod
+    def install_uvloop(cls) -> None:
+        """Sets uvloop event loop policy.
+
+        Recommended for workloads with many concurrent operations.
+        Must be called before the event loop is created.
+
+        Raises
+        ------
+        ImportError
+            If uvloop is not installed.
+        """
+        if not _UVLOOP:
+            raise ImportError("uvloop is not installed, install it with 'pip install uvloop'")
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     @abstractmethod
     def open(self, path: str, mode: str) -> AbstractAsyncContextManager[Any]:
         pass
@@ -47,3 +72,70 @@ class AsyncConnector(ABC):
     @abstractmethod
     async def scandir(self, path: str, recursive: bool = False) -> list[FSEntry]:
         pass
+
+    async def scandir_iter(self, path: str, recursive: bool = False) -> AsyncGenerator[FSEntry, None]:
+        """Iterate over directory entries.
+
+        Yields entries as they are listed, so that callers can start working
+        before the whole directory is scanned.
+
+        Parameters
+        ----------
+        path : str
+            Path to directory.
+        recursive : bool, default=False
+            Scan recursively.
+
+        Yields
+        -------
+        FSEntry
+            Directory entry.
+        """
+        for entry in await self.scandir(path, recursive):
+            yield entry
+
+    async def read_bytes(self, path: str) -> bytes:
+        """Read whole file.
+
+        Parameters
+        ----------
+        path : str
+            Path to file.
+
+        Returns
+        -------
+        bytes
+            File content.
+        """
+        async with self.open(path, 'rb') as f:
+            data: bytes = await f.read()
+        return data
+
+    async def write_bytes(self, path: str, data: bytes) -> None:
+        """Write whole file.
+
+        Parameters
+        ----------
+        path : str
+            Path to file.
+        data : bytes
+            File content.
+        """
+        async with self.open(path, 'wb') as f:
+            await f.write(data)
+
+    async def write_stream(self, path: str, chunks: AsyncIterable[bytes], size: Optional[int] = None) -> None:
+        """Write file from chunks stream.
+
+        Parameters
+        ----------
+        path : str
+            Path to file.
+        chunks : AsyncIterable[bytes]
+            File content chunks.
+        size : Optional[int], default=None
+            Expected file size in bytes, if known.
+        """
+        async with self.open(path, 'wb') as f:
+            async for chunk in chunks:
+                await f.write(chunk)
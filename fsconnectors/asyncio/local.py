@@ -1,49 +1,96 @@
-import datetime
+import asyncio
+import errno
 import os
+import shutil
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Optional, TypeVar
 
 import aiofiles
 import aiofiles.os
-import aioshutil
 from aiofiles.base import AiofilesContextManager
 
 from fsconnectors.asyncio.connector import AsyncConnector
 from fsconnectors.utils.entry import FSEntry
+from fsconnectors.utils.statx import FileType, fast_type
+
+_T = TypeVar('_T')
 
 
 class AsyncLocalConnector(AsyncConnector):
-    """Async local file system connector."""
+    """Async local file system connector.
+
+    Attributes
+    ----------
+    max_workers : int, default=64
+        Max threads of the connector executor.
+    """
+
+    def __init__(self, max_workers: int = 64) -> None:
+        self.max_workers = max_workers
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @asynccontextmanager
+    async def connect(self) -> AsyncGenerator['AsyncLocalConnector', None]:
+        """Connects to file system.
+
+        Starts a dedicated thread pool for file system calls, so that
+        bursts of them do not queue on the event loop default executor.
+        Reuses the pool if the connector is already connected.
+
+        Yields
+        -------
+        AsyncLocalConnector
+            Class instance.
+        """
+        if self._executor is not None:
+            yield self
+            return
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='fsc-io')
+        self._executor = executor
+        self._sem = asyncio.Semaphore(self.max_workers * 2)
+        try:
+            yield self
+        finally:
+            self._executor = None
+            self._sem = None
+            executor.shutdown(wait=False)
 
     def open(self, path: str, mode: str = 'r') -> AiofilesContextManager:
-        return aiofiles.open(path, mode)
+        return aiofiles.open(path, mode, executor=self._executor)
 
     async def mkdir(self, path: str) -> None:
-        await aiofiles.os.makedirs(path, exist_ok=True)
+        await aiofiles.os.makedirs(path, exist_ok=True, executor=self._executor)
 
     async def copy(self, src_path: str, dst_path: str, recursive: bool = False) -> None:
-        if not await aiofiles.os.path.exists(src_path):
-            raise FileNotFoundError(f"No such file or directory: '{src_path}'")
-        elif await aiofiles.os.path.isdir(src_path) and recursive:
-            await aioshutil.copytree(src_path, dst_path)
-        elif await aiofiles.os.path.isfile(src_path):
-            await aioshutil.copyfile(src_path, dst_path)
+        file_type = await self._classify(src_path)
+        if file_type == 'dir' and recursive:
+            await self._run(shutil.copytree, src_path, dst_path)
+        elif file_type == 'file':
+            await self._run(shutil.copyfile, src_path, dst_path)
         else:
             raise ValueError(f"'{src_path}' is a directory, but recursive mode is disabled")
 
     async def move(self, src_path: str, dst_path: str, recursive: bool = False) -> None:
-        if not await aiofiles.os.path.exists(src_path):
-            raise FileNotFoundError(f"No such file or directory: '{src_path}'")
-        elif (await aiofiles.os.path.isdir(src_path) and recursive) or await aiofiles.os.path.isfile(src_path):
-            await aiofiles.os.rename(src_path, dst_path)
-        else:
+        if not recursive and await self._classify(src_path) != 'file':
             raise ValueError(f"'{src_path}' is a directory, but recursive mode is disabled")
+        try:
+            await aiofiles.os.rename(src_path, dst_path, executor=self._executor)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            await self.copy(src_path, dst_path, recursive)
+            await self.remove(src_path, recursive)
 
     async def remove(self, path: str, recursive: bool = False) -> None:
-        if not await aiofiles.os.path.exists(path):
-            raise FileNotFoundError(f"No such file or directory: '{path}'")
-        elif await aiofiles.os.path.isdir(path) and recursive:
-            await aioshutil.rmtree(path)
-        elif await aiofiles.os.path.isfile(path):
-            await aiofiles.os.remove(path)
+        file_type = await self._classify(path)
+        if file_type == 'dir' and recursive:
+            await self._run(shutil.rmtree, path)
+        elif file_type == 'file':
+            await aiofiles.os.remove(path, executor=self._executor)
         else:
             raise ValueError(f"'{path}' is a directory, but recursive mode is disabled")
 
@@ -57,26 +104,217 @@ class AsyncLocalConnector(AsyncConnector):
                     result.append(os.path.join(root, name))
             return result
         else:
-            result = await aiofiles.os.listdir(path)
+            result = await aiofiles.os.listdir(path, executor=self._executor)
             return result
 
     async def scandir(self, path: str, recursive: bool = False) -> list[FSEntry]:
-        result = []
         if recursive:
-            for root, dirs, files in os.walk(path):  # TODO: async
-                for name in dirs:
-                    result.append(FSEntry(name, os.path.join(root, name), 'dir'))
-                for name in files:
-                    path = os.path.join(root, name)
-                    size = await aiofiles.os.path.getsize(path)
-                    last_modified = datetime.datetime.fromtimestamp(await aiofiles.os.path.getmtime(path))
-                    result.append(FSEntry(name, path, 'file', size, last_modified))
+            result = await _walk(path, self._sem or asyncio.Semaphore(self.max_workers * 2), self._executor)
         else:
-            async for entry in aiofiles.os.scandir(path):
-                if entry.is_dir():
-                    result.append(FSEntry(entry.name, entry.path, 'dir'))
-                elif entry.is_file():
-                    size = entry.stat().st_size
-                    last_modified = datetime.datetime.fromtimestamp(entry.stat().st_mtime)
-                    result.append(FSEntry(entry.name, entry.path, 'file', size, last_modified))
+            result, _ = await self._run(_scan_dir, path)
         return result
+
+    async def scandir_iter(self, path: str, recursive: bool = False) -> AsyncGenerator[FSEntry, None]:
+        if recursive:
+            async for entries in _iter_walk(path, self.max_workers * 2, self._executor):
+                for entry in entries:
+                    yield entry
+        else:
+            entries, _ = await self._run(_scan_dir, path)
+            for entry in entries:
+                yield entry
+
+    async def read_bytes(self, path: str) -> bytes:
+        """Read whole file.
+
+        Opens, reads and closes the file in a single thread pool call.
+
+        Parameters
+        ----------
+        path : str
+            Path to file.
+
+        Returns
+        -------
+        bytes
+            File content.
+        """
+        return await self._run(_read_all, path)
+
+    async def write_bytes(self, path: str, data: bytes) -> None:
+        """Write whole file.
+
+        Opens, writes and closes the file in a single thread pool call.
+
+        Parameters
+        ----------
+        path : str
+            Path to file.
+        data : bytes
+            File content.
+        """
+        await self._run(_write_all, path, data)
+
+    async def write_stream(self, path: str, chunks: AsyncIterable[bytes], size: Optional[int] = None) -> None:
+        """Write file from chunks stream.
+
+        Receiving chunks overlaps with writing them: chunks are queued and written
+        in batches with os.writev, where available, by a thread pool worker. If size is known,
+        the file space is preallocated.
+
+        Parameters
+        ----------
+        path : str
+            Path to file.
+        chunks : AsyncIterable[bytes]
+            File content chunks.
+        size : Optional[int], default=None
+            Expected file size in bytes, if known.
+        """
+        fd = await self._run(_open_for_write, path, size)
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize=16)
+        written = 0
+        job: Optional[asyncio.Future[int]] = None
+
+        async def write_chunks() -> None:
+            nonlocal written, job
+            while True:
+                batch = [await queue.get()]
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+                data = [chunk for chunk in batch if chunk is not None]
+                if data:
+                    # shielded, cancelling the writer does not stop the worker thread
+                    job = loop.run_in_executor(self._executor, _writev_all, fd, data)
+                    written += await asyncio.shield(job)
+                if batch[-1] is None:
+                    return
+
+        async def put(item: Optional[bytes]) -> None:
+            if writer.done():
+                writer.result()
+            if not queue.full():
+                queue.put_nowait(item)
+                return
+            put_task = asyncio.ensure_future(queue.put(item))
+            await asyncio.wait((put_task, writer), return_when=asyncio.FIRST_COMPLETED)
+            if not put_task.done():
+                put_task.cancel()
+                writer.result()  # the writer failed, nothing reads the queue any more
+
+        writer = asyncio.ensure_future(write_chunks())
+        try:
+            async for chunk in chunks:
+                await put(chunk)
+            await put(None)
+            await writer
+            if size is not None and written != size:
+                await self._run(os.ftruncate, fd, written)
+        finally:
+            writer.cancel()
+            # the fd must stay open until the last write job has returned
+            running: set[asyncio.Future[Any]] = {writer} if job is None else {writer, job}
+            await asyncio.wait(running)
+            await self._run(os.close, fd)
+
+    async def _classify(self, path: str) -> FileType:
+        file_type = await self._run(fast_type, path)
+        if file_type == 'missing':
+            raise FileNotFoundError(f"No such file or directory: '{path}'")
+        return file_type
+
+    async def _run(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run blocking call in the connector thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+
+async def _walk(path: str, sem: asyncio.Semaphore, executor: Optional[ThreadPoolExecutor]) -> list[FSEntry]:
+    loop = asyncio.get_running_loop()
+    result = []
+
+    async def walk_dir(dir_path: str) -> None:
+        async with sem:
+            entries, subdirs = await loop.run_in_executor(executor, _scan_dir, dir_path)
+        result.extend(entries)
+        await asyncio.gather(*[walk_dir(subdir) for subdir in subdirs])
+
+    await walk_dir(path)
+    return result
+
+
+async def _iter_walk(
+    path: str,
+    max_tasks: int,
+    executor: Optional[ThreadPoolExecutor]
+) -> AsyncGenerator[list[FSEntry], None]:
+    loop = asyncio.get_running_loop()
+    dirs = deque([path])
+    running: set[asyncio.Future[tuple[list[FSEntry], list[str]]]] = set()
+    try:
+        while dirs or running:
+            while dirs and len(running) < max_tasks:
+                running.add(loop.run_in_executor(executor, _scan_dir, dirs.popleft()))
+            done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                entries, subdirs = task.result()
+                dirs.extend(subdirs)
+                yield entries
+    finally:
+        for task in running:
+            task.cancel()
+
+
+def _scan_dir(path: str) -> tuple[list[FSEntry], list[str]]:
+    result = []
+    subdirs = []
+    files: list[tuple[int, FSEntry]] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir():
+                result.append(FSEntry(entry.name, entry.path, 'dir'))
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            elif entry.is_file():
+                st = entry.stat()
+                files.append((st.st_ino, FSEntry(entry.name, entry.path, 'file', st.st_size, st.st_mtime)))
+    # files in inode order are mostly laid out sequentially on disk, so reading
+    # them in this order saves seeks; st_ino is 0 on Windows and the order is kept
+    files.sort(key=lambda item: item[0])
+    result.extend(entry for _, entry in files)
+    return result, subdirs
+
+
+def _read_all(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _write_all(path: str, data: bytes) -> None:
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _open_for_write(path: str, size: Optional[int]) -> int:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    if size and hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            pass
+    return fd
+
+
+def _writev_all(fd: int, chunks: list[bytes]) -> int:
+    total = sum(len(chunk) for chunk in chunks)
+    if not hasattr(os, 'writev'):  # Windows
+        for chunk in chunks:
+            while chunk:
+                chunk = chunk[os.write(fd, chunk):]
+        return total
+    written = os.writev(fd, chunks)
+    if written < total:
+        data = b''.join(chunks)[written:]
+        while data:
+            data = data[os.write(fd, data):]
+    return total
@@ -0,0 +1,218 @@
+import asyncio
+import errno
+import os
+import platform
+import sys
+from collections import deque
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from fsconnectors.asyncio.local import AsyncLocalConnector
+from fsconnectors.utils.statx import AT_STATX_DONT_SYNC, STATX_TYPE, FileType
+
+try:
+    import liburing
+    _LIBURING = True
+except ImportError:
+    _LIBURING = False
+
+QUEUE_DEPTH = 128
+MAX_IO_SIZE = 0x7ffff000  # largest single read/write on Linux
+
+_Op = tuple[str, tuple[Any, ...]]
+
+
+def uring_available() -> bool:
+    """Check if io_uring can be used.
+
+    Returns
+    -------
+    bool
+        True on Linux 5.6+ with liburing installed.
+    """
+    if not _LIBURING or not sys.platform.startswith('linux'):
+        return False
+    try:
+        version = tuple(int(part) for part in platform.release().split('-')[0].split('.')[:2])
+    except ValueError:
+        return False
+    return version >= (5, 6)
+
+
+class AsyncLocalUringConnector(AsyncLocalConnector):
+    """Async local file system connector backed by io_uring.
+
+    File type checks, whole-file reads and writes are submitted to a ring
+    owned by the connector. Requests issued in the same event loop tick are
+    batched into a single submission of up to QUEUE_DEPTH entries. Without
+    liburing or on kernels older than 5.6 it behaves as AsyncLocalConnector.
+
+    Attributes
+    ----------
+    max_workers : int, default=64
+        Max threads of the connector executor.
+    """
+
+    def __init__(self, max_workers: int = 64) -> None:
+        super().__init__(max_workers)
+        self._ring: Any = None
+        self._pending: deque[tuple[list[_Op], asyncio.Future[list[int]]]] = deque()
+        self._flushing = False
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+    @asynccontextmanager
+    async def connect(self) -> AsyncGenerator['AsyncLocalUringConnector', None]:
+        """Connects to file system.
+
+        Sets up the ring if io_uring is available.
+        Reuses the ring if the connector is already connected.
+
+        Yields
+        -------
+        AsyncLocalUringConnector
+            Class instance.
+        """
+        if self._executor is not None:
+            yield self
+            return
+        async with super().connect():
+            if uring_available():
+                ring = liburing.Ring()
+                liburing.io_uring_queue_init(QUEUE_DEPTH, ring)
+                self._ring = ring
+            try:
+                yield self
+            finally:
+                # running batches use the ring in a worker thread
+                await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+                if self._ring is not None:
+                    liburing.io_uring_queue_exit(self._ring)
+                    self._ring = None
+
+    async def read_bytes(self, path: str) -> bytes:
+        if self._ring is None:
+            return await super().read_bytes(path)
+        stat = liburing.Statx()
+        how = liburing.OpenHow(os.O_RDONLY | os.O_CLOEXEC, 0, 0)
+        stat_res, fd = await asyncio.gather(
+            self._submit([('statx', (stat, path, 0, liburing.STATX_SIZE))]),
+            self._submit([('openat2', (path, how))])
+        )
+        _check(fd[0], path)
+        if stat_res[0] < 0 or stat.size > MAX_IO_SIZE:
+            await self._submit([('close', (fd[0],))])
+            _check(stat_res[0], path)
+            return await super().read_bytes(path)
+        # one spare byte tells EOF at the stat size from a grown file
+        buf = bytearray(stat.size + 1)
+        read_res, close_res = await self._submit([('read', (fd[0], buf)), ('close', (fd[0],))])
+        _check(read_res, path)
+        _check(close_res, path)
+        if read_res != stat.size:
+            # short read, growing or pseudo file such as /proc/self/status
+            return await super().read_bytes(path)
+        del buf[-1]
+        return bytes(buf)
+
+    async def write_bytes(self, path: str, data: bytes) -> None:
+        if self._ring is None or len(data) > MAX_IO_SIZE:
+            return await super().write_bytes(path, data)
+        how = liburing.OpenHow(os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o666, 0)
+        (fd,) = await self._submit([('openat2', (path, how))])
+        _check(fd, path)
+        write_res, close_res = await self._submit([('write', (fd, data)), ('close', (fd,))])
+        _check(write_res, path)
+        _check(close_res, path)
+        if write_res < len(data):
+            await self._run(_write_tail, path, data, write_res)
+
+    async def _classify(self, path: str) -> FileType:
+        if self._ring is None:
+            return await super()._classify(path)
+        stat = liburing.Statx()
+        (res,) = await self._submit([('statx', (stat, path, AT_STATX_DONT_SYNC, STATX_TYPE))])
+        if res in (-errno.ENOENT, -errno.ENOTDIR):
+            raise FileNotFoundError(f"No such file or directory: '{path}'")
+        _check(res, path)
+        if stat.isdir:
+            return 'dir'
+        elif stat.isfile:
+            return 'file'
+        return 'other'
+
+    async def _submit(self, chain: list[_Op]) -> list[int]:
+        """Queue linked operations and wait for their results.
+
+        Operations of a chain are hard-linked, so every one of them
+        is executed even if a previous one fails.
+        """
+        future: asyncio.Future[list[int]] = asyncio.get_running_loop().create_future()
+        self._pending.append((chain, future))
+        if not self._flushing:
+            self._flushing = True
+            task = asyncio.ensure_future(self._flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        return await future
+
+    async def _flush(self) -> None:
+        try:
+            while self._pending:
+                batch: list[tuple[list[_Op], asyncio.Future[list[int]]]] = []
+                size = 0
+                while self._pending and size + len(self._pending[0][0]) <= QUEUE_DEPTH:
+                    batch.append(self._pending.popleft())
+                    size += len(batch[-1][0])
+                try:
+                    results = await self._run(_run_batch, self._ring, [chain for chain, _ in batch])
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            self._flushing = False
+
+
+def _run_batch(ring: Any, chains: list[list[_Op]]) -> list[list[int]]:
+    total = 0
+    for chain in chains:
+        for i, (op, args) in enumerate(chain):
+            sqe = liburing.io_uring_get_sqe(ring)
+            getattr(liburing, f'io_uring_prep_{op}')(sqe, *args)
+            if i < len(chain) - 1:
+                liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_IO_HARDLINK)
+            liburing.io_uring_sqe_set_data64(sqe, total)
+            total += 1
+    liburing.io_uring_submit_and_wait(ring, total)
+    results = [0] * total
+    cqe = liburing.Cqe()
+    for _ in range(total):
+        liburing.io_uring_wait_cqe(ring, cqe)
+        entry = cqe[0]
+        try:
+            results[entry.user_data] = entry.res
+        except OSError as e:
+            results[entry.user_data] = -(e.errno or 0)
+        liburing.io_uring_cqe_seen(ring, entry)
+    output = []
+    offset = 0
+    for chain in chains:
+        output.append(results[offset:offset + len(chain)])
+        offset += len(chain)
+    return output
+
+
+def _write_tail(path: str, data: bytes, offset: int) -> None:
+    with open(path, 'r+b') as f:
+        f.seek(offset)
+        f.write(memoryview(data)[offset:])
+
+
+def _check(res: int, path: str) -> None:
+    if res < 0:
+        raise OSError(-res, os.strerror(-res), path)
@@ -1,19 +1,32 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from typing import IO, Any, Union
+from typing import IO, Any, Optional, Union
 
 import aioboto3
-import yaml
+import jmespath
 from botocore.config import Config
 
 from fsconnectors.asyncio.connector import AsyncConnector
+from fsconnectors.utils.config import load_config
 from fsconnectors.utils.entry import FSEntry
+from fsconnectors.utils.pool import TaskPool
 from fsconnectors.utils.s3 import (
+    RETRY_MAX_ATTEMPTS,
     AsyncMultipartWriter,
+    AsyncS3ParallelReader,
     AsyncS3Reader,
+    AsyncS3Writer,
     AsyncSinglepartWriter,
 )
 
+MULTIPART_COPY_THRESHOLD = 1024 * 1024 * 100
+
+_CONTENTS = jmespath.compile('Contents[].[Key, Size, LastModified]')
+_PREFIXES = jmespath.compile('CommonPrefixes[].Prefix')
+_KEYS = jmespath.compile('Contents[].Key')
+_SIZES = jmespath.compile('Contents[].[Key, Size]')
+
 
 class AsyncS3Connector(AsyncConnector):
     """Async S3 connector.
@@ -26,61 +39,98 @@ class AsyncS3Connector(AsyncConnector):
         AWS access key ID
     aws_secret_access_key : str
         AWS secret access key
+    pool_size : int, default=256
+        Max number of pooled HTTP connections.
     """
 
     def __init__(
         self,
         endpoint_url: str,
         aws_access_key_id: str,
-        aws_secret_access_key: str
+        aws_secret_access_key: str,
+        pool_size: int = 256
     ) -> None:
         self.endpoint_url = endpoint_url
         self.aws_access_key_id = aws_access_key_id
         self.aws_secret_access_key = aws_secret_access_key
+        self.pool_size = pool_size
         self.client: Any = None
+        self._client_cm: Any = None
+        self._list_paginator: Any = None
 
     @asynccontextmanager
     async def connect(self) -> AsyncGenerator['AsyncS3Connector', None]:
         """Connects to file system.
 
+        Reuses the client if the connector is already connected,
+        in that case the client stays open on exit.
+
         Yields
         -------
         AsyncS3Connector
             Class instance
         """
-        async with aioboto3.Session().client(
-                's3', endpoint_url=self.endpoint_url,
-                aws_access_key_id=self.aws_access_key_id,
-                aws_secret_access_key=self.aws_secret_access_key,
-                config=Config(s3={'addressing_style': 'virtual'})
-        ) as client:
-            self.client = client
+        if self.client is not None:
+            yield self
+            return
+        await self._create_client()
+        try:
             yield self
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Closes the client."""
+        if self._client_cm is not None:
+            client_cm, self._client_cm = self._client_cm, None
+            self.client = None
+            self._list_paginator = None
+            await client_cm.__aexit__(None, None, None)
+
+    async def _create_client(self) -> None:
+        client_cm = aioboto3.Session().client(
+            's3', endpoint_url=self.endpoint_url,
+            aws_access_key_id=self.aws_access_key_id,
+            aws_secret_access_key=self.aws_secret_access_key,
+            config=Config(
+                s3={'addressing_style': 'virtual'},
+                max_pool_connections=self.pool_size,
+                tcp_keepalive=True,
+                retries={'max_attempts': RETRY_MAX_ATTEMPTS, 'mode': 'adaptive'}
+            )
+        )
+        self.client = await client_cm.__aenter__()
+        self._client_cm = client_cm
+        self._list_paginator = self.client.get_paginator('list_objects_v2')
 
     @classmethod
-    def from_yaml(cls, path: str) -> 'AsyncS3Connector':
+    def from_yaml(cls, path: str, **kwargs: Any) -> 'AsyncS3Connector':
         """Creates class instance from configuration path.
 
         Parameters
         ----------
         path : str
             path to configuration file.
+        **kwargs : Any
+            Overrides of configuration values, e.g. pool_size.
 
         Returns
         -------
         AsyncS3Connector
             Class instance.
         """
-        with open(path) as f:
-            config = yaml.safe_load(f)
+        config = load_config(path)
+        config.update(kwargs)
         return cls(**config)
 
     def open(
         self,
         path: str,
         mode: str = 'rb',
-        multipart: bool = False
-    ) -> Union[AsyncS3Reader, AsyncMultipartWriter, AsyncSinglepartWriter]:
+        multipart: Optional[bool] = None,
+        parallel: bool = False,
+        concurrency: int = 1
+    ) -> Union[AsyncS3Reader, AsyncS3ParallelReader, AsyncMultipartWriter, AsyncSinglepartWriter, AsyncS3Writer]:
         """Open file
 
         Parameters
@@ -89,21 +139,32 @@ class AsyncS3Connector(AsyncConnector):
             Path to file.
         mode : str
             Open mode.
-        multipart : bool, default=False
-            Use multipart writer.
+        multipart : Optional[bool], default=None
+            Use multipart writer. If not set, the writer starts
+            a multipart upload once data exceeds a single part.
+        parallel : bool, default=False
+            Use parallel ranged reader.
+        concurrency : int, default=1
+            Max parts uploaded at once by multipart writer.
 
         Returns
         -------
-        Union[AsyncS3Reader, AsyncMultipartWriter, AsyncSinglepartWriter]
+        Union[AsyncS3Reader, AsyncS3ParallelReader, AsyncMultipartWriter, AsyncSinglepartWriter, AsyncS3Writer]
             Readable/writable file-like object.
         """
-        stream: Union[AsyncS3Reader, AsyncMultipartWriter, AsyncSinglepartWriter]
+        stream: Union[AsyncS3Reader, AsyncS3ParallelReader, AsyncMultipartWriter, AsyncSinglepartWriter, AsyncS3Writer]
         bucket, key = self._split_path(path)
         if mode in ['r', 'rb', 'rt']:
-            stream = AsyncS3Reader(self.client, bucket=bucket, key=key, mode=mode)
+            if parallel:
+                stream = AsyncS3ParallelReader(self.client, bucket=bucket, key=key, mode=mode)
+            else:
+                stream = AsyncS3Reader(self.client, bucket=bucket, key=key, mode=mode)
         elif mode in ['w', 'wb', 'wt']:
-            if multipart:
-                stream = AsyncMultipartWriter(self.client, bucket=bucket, key=key, mode=mode)
+            if multipart is None:
+                stream = AsyncS3Writer(self.client, bucket=bucket, key=key, mode=mode, concurrency=concurrency)
+            elif multipart:
+                stream = AsyncMultipartWriter(self.client, bucket=bucket, key=key, mode=mode,
+                                              concurrency=concurrency)
             else:
                 stream = AsyncSinglepartWriter(self.client, bucket=bucket, key=key, mode=mode)
         else:
@@ -119,11 +180,15 @@ class AsyncS3Connector(AsyncConnector):
         if recursive:
             src_bucket, src_key = self._split_path(src_path)
             dst_bucket, dst_key = self._split_path(dst_path)
-            paths = await self.listdir(src_path, recursive)
-            for path in paths:
-                path_bucket, path_key = self._split_path(path)
-                await self.client.copy({'Bucket': path_bucket, 'Key': path_key},
-                                       dst_bucket, path_key.replace(src_key, dst_key))
+            running: set[asyncio.Task[None]] = set()
+            # an error leaves the pool block, which cancels the copies still running
+            async with TaskPool(64) as pool:
+                async for path_key, size in self._iter_objects(src_bucket, src_key):
+                    _reap(running)
+                    running.add(await pool.spawn(
+                        self._copy_object(src_bucket, path_key, dst_bucket, dst_key + path_key[len(src_key):], size)
+                    ))
+                await _wait_all(running)
         else:
             src_bucket, src_key = self._split_path(src_path)
             dst_bucket, dst_key = self._split_path(dst_path)
@@ -135,10 +200,20 @@ class AsyncS3Connector(AsyncConnector):
 
     async def remove(self, path: str, recursive: bool = False) -> None:
         if recursive:
-            paths = await self.listdir(path, recursive)
-            for path in paths:
-                path_bucket, path_key = self._split_path(path)
-                await self.client.delete_object(Bucket=path_bucket, Key=path_key)
+            bucket, prefix = self._split_path(path)
+            running: set[asyncio.Task[None]] = set()
+            batch: list[str] = []
+            # an error or cancellation leaves the pool block, which cancels the batches still running
+            async with TaskPool(16) as pool:
+                async for key in self._iter_keys(bucket, prefix):
+                    batch.append(key)
+                    if len(batch) == 1000:
+                        _reap(running)
+                        running.add(await pool.spawn(self._delete_objects(bucket, batch)))
+                        batch = []
+                if batch:
+                    running.add(await pool.spawn(self._delete_objects(bucket, batch)))
+                await _wait_all(running)
         else:
             bucket, key = self._split_path(path)
             await self.client.delete_object(Bucket=bucket, Key=key)
@@ -151,37 +226,80 @@ class AsyncS3Connector(AsyncConnector):
             result = [entry.name for entry in entries]
         return result
 
-    async def scandir(self, path: str, recursive: bool = False) -> list[FSEntry]:
-        result = []
+    async def scandir(self, path: str, recursive: bool = False, parallel: int = 1) -> list[FSEntry]:
+        """Get directory entries.
+
+        Parameters
+        ----------
+        path : str
+            Path to directory.
+        recursive : bool, default=False
+            Scan recursively.
+        parallel : int, default=1
+            Max concurrent listings in recursive mode. If greater than 1, top level
+            subdirectories are listed concurrently.
+
+        Returns
+        -------
+        list[FSEntry]
+            List of directory entries.
+        """
+        result: list[FSEntry] = []
         bucket, prefix = self._split_path(path)
-        paginator = self.client.get_paginator('list_objects')
-        if recursive:
-            paginator_result = paginator.paginate(Bucket=bucket, Prefix=prefix, PaginationConfig={'PageSize': 1000})
-        else:
-            paginator_result = paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter='/',
-                                                  PaginationConfig={'PageSize': 1000})
-        async for item in paginator_result.search('Contents'):
-            if item:
-                path = bucket + '/' + item.get('Key')
-                name = path.split('/')[-1]
-                if name:
-                    size = item.get('Size')
-                    last_modified = item.get('LastModified')
-                    result.append(FSEntry(name, path, 'file', size, last_modified))
-        paginator = self.client.get_paginator('list_objects')
-        if recursive:
-            paginator_result = paginator.paginate(Bucket=bucket, Prefix=prefix, PaginationConfig={'PageSize': 1000})
-        else:
-            paginator_result = paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter='/',
-                                                  PaginationConfig={'PageSize': 1000})
-        async for item in paginator_result.search('CommonPrefixes'):
-            if item:
-                path = bucket + '/' + item.get('Prefix')
-                name = path.split('/')[-2]
-                if name:
-                    result.append(FSEntry(name, path, 'dir'))
+        if recursive and parallel > 1:
+            top_level = await self.scandir(path, recursive=False)
+            sem = asyncio.Semaphore(parallel)
+
+            async def scan_prefix(dir_prefix: str) -> list[FSEntry]:
+                async with sem:
+                    return await self.scandir(dir_prefix, recursive=True)
+
+            result.extend(entry for entry in top_level if entry.type == 'file')
+            for entries in await asyncio.gather(*[scan_prefix(entry.path) for entry in top_level if entry.type == 'dir']):
+                result.extend(entries)
+            return result
+        async for page in self._iter_pages(bucket, prefix, recursive):
+            result.extend(self._page_entries(bucket, page))
         return result
 
+    async def scandir_iter(self, path: str, recursive: bool = False) -> AsyncGenerator[FSEntry, None]:
+        bucket, prefix = self._split_path(path)
+        async for page in self._iter_pages(bucket, prefix, recursive):
+            for entry in self._page_entries(bucket, page):
+                yield entry
+
+    async def read_bytes(self, path: str) -> bytes:
+        """Read whole object with a single get_object request.
+
+        Parameters
+        ----------
+        path : str
+            Path to file.
+
+        Returns
+        -------
+        bytes
+            File content.
+        """
+        bucket, key = self._split_path(path)
+        obj = await self.client.get_object(Bucket=bucket, Key=key)
+        async with obj['Body'] as stream:
+            data: bytes = await stream.read()
+        return data
+
+    async def write_bytes(self, path: str, data: bytes) -> None:
+        """Write whole object with a single put_object request.
+
+        Parameters
+        ----------
+        path : str
+            Path to file.
+        data : bytes
+            File content.
+        """
+        bucket, key = self._split_path(path)
+        await self.client.put_object(Bucket=bucket, Key=key, Body=data)
+
     async def upload_fileobj(
         self,
         fileobj: IO[Any],
@@ -199,10 +317,88 @@ class AsyncS3Connector(AsyncConnector):
         bucket, key = self._split_path(dst_path)
         await self.client.upload_fileobj(fileobj, bucket, key)
 
+    async def _iter_pages(self, bucket: str, prefix: str, recursive: bool) -> AsyncGenerator[dict[str, Any], None]:
+        """Iterate over listing pages, requesting the next page while the current one is processed.
+
+        Continuation tokens make the requests themselves sequential.
+        """
+        if recursive:
+            pages = self._list_paginator.paginate(Bucket=bucket, Prefix=prefix, MaxKeys=1000)
+        else:
+            pages = self._list_paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter='/', MaxKeys=1000)
+        pages_iter = pages.__aiter__()
+        next_page = asyncio.ensure_future(pages_iter.__anext__())
+        try:
+            while True:
+                try:
+                    page = await next_page
+                except StopAsyncIteration:
+                    return
+                next_page = asyncio.ensure_future(pages_iter.__anext__())
+                yield page
+        finally:
+            next_page.cancel()
+
     @staticmethod
-    def _split_path(path: str) -> list[str]:
-        path = path.split('://')[-1]
-        parts = path.split('/', maxsplit=1)
-        if len(parts) == 1:
-            parts.append('')
-        return parts
+    def _page_entries(bucket: str, page: dict[str, Any]) -> list[FSEntry]:
+        result = [
+            FSEntry(name, f'{bucket}/{key}', 'file', size, last_modified.timestamp())
+            for key, size, last_modified in _CONTENTS.search(page) or ()
+            if (name := key.rpartition('/')[2])
+        ]
+        for dir_prefix in _PREFIXES.search(page) or ():
+            name = dir_prefix[:-1].rpartition('/')[2]
+            if name:
+                result.append(FSEntry(name, f'{bucket}/{dir_prefix}', 'dir'))
+        return result
+
+    async def _iter_keys(self, bucket: str, prefix: str) -> AsyncGenerator[str, None]:
+        paginator_result = self._list_paginator.paginate(Bucket=bucket, Prefix=prefix, MaxKeys=1000)
+        async for page in paginator_result:
+            for key in _KEYS.search(page) or ():
+                yield key
+
+    async def _iter_objects(self, bucket: str, prefix: str) -> AsyncGenerator[tuple[str, int], None]:
+        paginator_result = self._list_paginator.paginate(Bucket=bucket, Prefix=prefix, MaxKeys=1000)
+        async for page in paginator_result:
+            for key, size in _SIZES.search(page) or ():
+                yield key, size
+
+    async def _copy_object(self, src_bucket: str, src_key: str, dst_bucket: str, dst_key: str, size: int) -> None:
+        if size < MULTIPART_COPY_THRESHOLD:
+            await self.client.copy_object(CopySource={'Bucket': src_bucket, 'Key': src_key},
+                                          Bucket=dst_bucket, Key=dst_key)
+        else:
+            await self.client.copy({'Bucket': src_bucket, 'Key': src_key}, dst_bucket, dst_key)
+
+    async def _delete_objects(self, bucket: str, keys: list[str]) -> None:
+        resp = await self.client.delete_objects(
+            Bucket=bucket,
+            Delete={'Objects': [{'Key': key} for key in keys], 'Quiet': True}
+        )
+        errors = resp.get('Errors', [])
+        if errors:
+            raise RuntimeError(f"Failed to delete {len(errors)} objects from '{bucket}', "
+                               f"'{errors[0]['Key']}': {errors[0]['Message']}")
+
+    @staticmethod
+    def _split_path(path: str) -> tuple[str, str]:
+        head, sep, tail = path.partition('://')
+        bucket, _, key = (tail if sep else head).partition('/')
+        return bucket, key
+
+
+def _reap(tasks: set[asyncio.Task[None]]) -> None:
+    """Drop finished tasks and raise the error of a failed one."""
+    done = {task for task in tasks if task.done()}
+    tasks -= done
+    for task in done:
+        task.result()
+
+
+async def _wait_all(tasks: set[asyncio.Task[None]]) -> None:
+    """Wait for tasks and raise the first error as soon as it occurs."""
+    while tasks:
+        done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            task.result()
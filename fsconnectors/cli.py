@@ -3,20 +3,29 @@ import asyncio
 import math
 import os.path
 import platform
-import re
-from typing import Union
+import random
+from collections.abc import AsyncGenerator, AsyncIterable
+from contextlib import suppress
+from functools import partial
+from typing import Any, Optional
 
-import asyncio_pool
+import botocore.exceptions
 from tqdm.auto import tqdm
 
 from fsconnectors import AsyncLocalConnector, AsyncS3Connector
 from fsconnectors.asyncio.connector import AsyncConnector
-from fsconnectors.utils.entry import FSEntry
-from fsconnectors.utils.s3 import (
-    AsyncMultipartWriter,
-    AsyncS3Reader,
-    AsyncSinglepartWriter,
-)
+from fsconnectors.asyncio.local_uring import AsyncLocalUringConnector
+from fsconnectors.utils.pool import TaskPool
+
+SMALL_FILE_SIZE = 1024 * 1024 * 5
+MIN_AUTO_PART_SIZE = 1024 * 1024 * 16
+MAX_AUTO_PART_SIZE = 1024 * 1024 * 256
+AUTO_PART_CONCURRENCY = 8
+MAX_AUTO_PART_BUFFER = 1024 * 1024 * 1024
+MAX_PART_SIZE = 1024 * 1024 * 1024 * 5
+MAX_PARTS_NUMBER = 10000
+MAX_RETRY_DELAY = 60
+RETRYABLE_ERROR_CODES = frozenset({'SlowDown', 'InternalError', 'ServiceUnavailable', 'RequestTimeout', 'Throttling'})
 
 
 class CLI:
@@ -24,10 +33,10 @@ class CLI:
 
     Attributes
     ----------
-    s3_connector : AsyncConnector
-        Async S3 connector.
+    s3_connector : AsyncS3Connector
+        Connected async S3 connector.
     local_connector : AsyncConnector
-        Async local connector.
+        Connected async local connector.
     """
 
     def __init__(
@@ -35,6 +44,8 @@ class CLI:
         s3_connector: AsyncConnector,
         local_connector: AsyncConnector
     ):
+        if not isinstance(s3_connector, AsyncS3Connector):
+            raise TypeError(f"s3_connector must be AsyncS3Connector, got '{type(s3_connector).__name__}'")
         self.s3_connector = s3_connector
         self.local_connector = local_connector
 
@@ -45,10 +56,12 @@ class CLI:
         num_workers: int = 16,
         multipart: bool = False,
         num_retries: int = 3,
-        chunk_size: int = 1024 * 1024 * 16,
+        chunk_size: Optional[int] = None,
         large_file_size: int = 1024 * 1024 * 128,
         max_chunks_number: int = 999,
-        delay: int = 3
+        delay: int = 3,
+        outer_workers: int = 4,
+        inner_workers: int = 4
     ) -> list[str]:
         """Upload to S3.
 
@@ -63,43 +76,56 @@ class CLI:
         multipart : bool, default=False
             Use multipart upload.
         num_retries : int, default=3
-            Max retries per file.
-        chunk_size : int, default=1024 * 1024 * 16
+            Max attempts per file and per chunk, at least 1.
+        chunk_size : Optional[int], default=None
             Chunk size in bytes for multipart upload if enabled.
+            If not set, it is chosen per file from the file size.
         large_file_size : int, default=1024 * 1024 * 128
             Min file size for multipart upload if enabled.
         max_chunks_number : int, default=999
             Max chunks for multipart upload if enabled.
         delay : int, default=3
             Retry delay.
+        outer_workers : int, default=4
+            Max large files uploaded at once if multipart upload enabled.
+        inner_workers : int, default=4
+            Max chunks uploaded at once per large file if multipart upload enabled.
 
         Returns
         -------
         list[str]
             Error files.
         """
+        if num_retries < 1:
+            raise ValueError(f'num_retries must be at least 1, got {num_retries}')
         s3_path, local_path = self._prepare_paths(s3_path, local_path)
-        async with self.local_connector.connect() as lc:
-            async with self.s3_connector.connect() as sc:
-                files = await lc.scandir(local_path, recursive=True)
-                files_pbar = tqdm(total=len([file for file in files if file.type == 'file']), desc='Files')
-                bytes_pbar = tqdm(total=sum([file.size if file.size is not None else 0 for file in files]), desc='Bytes')
-                error_files = []
-                if multipart:
-                    small_files, large_files = self._split_small_large_files(files, large_file_size)
-                    error_files += await self._upload_files(
-                        lc, sc, small_files, local_path, s3_path,
-                        files_pbar, bytes_pbar, num_workers, num_retries, delay
-                    )
-                    error_files += await self._upload_files_multipart(
-                        lc, sc, large_files, local_path, s3_path, files_pbar, bytes_pbar,
-                        num_workers, num_retries, chunk_size, max_chunks_number, delay
-                    )
+        lc, sc = self.local_connector, self.s3_connector
+        prefix_len = len(local_path)
+        error_files: list[str] = []
+        is_windows = platform.system() == 'Windows'
+        async with sc.connect(), lc.connect(), \
+                _BatchedProgress('Files') as files_pbar, _BatchedProgress('Bytes') as bytes_pbar, \
+                TaskPool(num_workers) as pool, TaskPool(outer_workers) as multipart_pool:
+            async for file in lc.scandir_iter(local_path, recursive=True):
+                if file.size is None:
+                    continue
+                files_pbar.add_total(1)
+                bytes_pbar.add_total(file.size)
+                relative_path = file.path[prefix_len:]
+                if is_windows:
+                    relative_path = relative_path.replace('\\', '/')
+                destination_path = s3_path + relative_path
+                if multipart and file.size > large_file_size:
+                    task = await multipart_pool.spawn(self._upload_file_multipart(
+                        lc, sc, file.path, destination_path, file.size, files_pbar, bytes_pbar,
+                        inner_workers, num_retries, chunk_size, max_chunks_number, delay
+                    ))
                 else:
-                    error_files += await self._upload_files(
-                        lc, sc, files, local_path, s3_path,
-                        files_pbar, bytes_pbar, num_workers, num_retries, delay
-                    )
+                    task = await pool.spawn(self._upload_file(
+                        lc, sc, file.path, destination_path, file.size,
+                        files_pbar, bytes_pbar, num_retries, delay
+                    ))
+                task.add_done_callback(partial(self._collect_error, error_files, file.path))
         return error_files
 
     async def download(
@@ -122,7 +148,7 @@ class CLI:
         num_workers : int, default=16
             Max workers.
         num_retries : int, default=3
-            Max retries per file.
+            Max attempts per file, at least 1.
         chunk_size : int, default=1024 * 1024 * 16
             Chunk size in bytes.
         delay : int, default=3
@@ -133,159 +159,153 @@ class CLI:
         list[str]
             Error files.
         """
+        if num_retries < 1:
+            raise ValueError(f'num_retries must be at least 1, got {num_retries}')
         s3_path, local_path = self._prepare_paths(s3_path, local_path)
-        async with self.local_connector.connect() as lc:
-            async with self.s3_connector.connect() as sc:
-                files = await sc.scandir(s3_path, recursive=True)
-                files_pbar = tqdm(total=len([file for file in files if file.type == 'file']), desc='Files')
-                bytes_pbar = tqdm(total=sum([file.size if file.size is not None else 0 for file in files]), desc='Bytes')
-                error_files = []
-                async with asyncio_pool.AioPool(size=num_workers) as pool:
-                    for file in files:
-                        if file.size is not None:
-                            destination_path = file.path.replace(s3_path, local_path, 1)
-                            status = await pool.spawn(self._download_file(
-                                lc, sc, file.path, destination_path, file.size,
-                                files_pbar, bytes_pbar, chunk_size, num_retries, delay
-                            ))
-                            if not status:
-                                error_files.append(file.path)
+        lc, sc = self.local_connector, self.s3_connector
+        prefix_len = len(s3_path)
+        error_files: list[str] = []
+        async with sc.connect(), lc.connect(), \
+                _BatchedProgress('Files') as files_pbar, _BatchedProgress('Bytes') as bytes_pbar, \
+                TaskPool(num_workers) as pool:
+            async for file in sc.scandir_iter(s3_path, recursive=True):
+                if file.size is None:
+                    continue
+                files_pbar.add_total(1)
+                bytes_pbar.add_total(file.size)
+                destination_path = local_path + file.path[prefix_len:]
+                task = await pool.spawn(self._download_file(
+                    lc, sc, file.path, destination_path, file.size,
+                    files_pbar, bytes_pbar, chunk_size, num_retries, delay
+                ))
+                task.add_done_callback(partial(self._collect_error, error_files, file.path))
         return error_files
 
-    async def _upload_files(
-        self,
-        local_connection: AsyncConnector,
-        s3_connection: AsyncConnector,
-        files: list[FSEntry],
-        local_path: str,
-        s3_path: str,
-        files_pbar: tqdm,
-        bytes_pbar: tqdm,
-        num_workers: int = 16,
-        num_retries: int = 3,
-        delay: int = 3
-    ) -> list[str]:
-        error_files = []
-        async with asyncio_pool.AioPool(size=num_workers) as pool:
-            for file in files:
-                if file.size is not None:
-                    destination_path = file.path.replace(local_path, s3_path, 1)
-                    status = await pool.spawn(self._upload_file(
-                        local_connection, s3_connection, file.path, destination_path, file.size,
-                        files_pbar, bytes_pbar, num_retries, delay
-                    ))
-                    if not status:
-                        error_files.append(file.path)
-        return error_files
+    @staticmethod
+    def _collect_error(error_files: list[str], path: str, task: 'asyncio.Task[bool]') -> None:
+        if task.cancelled() or task.exception() is not None or not task.result():
+            error_files.append(path)
 
     @staticmethod
     async def _upload_file(
         local_connection: AsyncConnector,
-        s3_connection: AsyncConnector,
+        s3_connection: AsyncS3Connector,
         source_path: str,
         destination_path: str,
         file_size: int,
-        files_pbar: tqdm,
-        bytes_pbar: tqdm,
+        files_pbar: '_BatchedProgress',
+        bytes_pbar: '_BatchedProgress',
         num_retries: int = 3,
         delay: int = 3
     ) -> bool:
-        retries = 0
-        while retries < num_retries:
+        err_msg: Optional[Exception] = None
+        for attempt in range(num_retries):
             try:
-                retries += 1
-                async with local_connection.open(source_path, 'rb') as src_file:
-                    if isinstance(s3_connection, AsyncS3Connector):
+                if file_size < SMALL_FILE_SIZE:
+                    data = await local_connection.read_bytes(source_path)
+                    await s3_connection.write_bytes(destination_path, data)
+                else:
+                    async with local_connection.open(source_path, 'rb') as src_file:
                         await s3_connection.upload_fileobj(src_file, destination_path)
                 files_pbar.update(1)
                 bytes_pbar.update(file_size)
                 return True
             except Exception as err:
                 err_msg = err
-                await asyncio.sleep(delay)
+                if attempt == num_retries - 1 or not _is_retryable(err):
+                    break
+                await asyncio.sleep(_backoff(delay, attempt))
         print(err_msg)
         files_pbar.update(1)
-        bytes_pbar.update(file_size)
         return False
 
-    async def _upload_files_multipart(
-        self,
-        local_connection: AsyncConnector,
-        s3_connection: AsyncConnector,
-        files: list[FSEntry],
-        local_path: str,
-        s3_path: str,
-        files_pbar: tqdm,
-        bytes_pbar: tqdm,
-        num_workers: int = 16,
-        num_retries: int = 3,
-        chunk_size: int = 1024 * 1024 * 16,
-        max_chunks_number: int = 999,
-        delay: int = 3
-    ) -> list[str]:
-        error_files = []
-        for file in files:
-            if file.size is not None:
-                destination_path = file.path.replace(local_path, s3_path, 1)
-                status = await self._upload_file_multipart(
-                    local_connection, s3_connection, file.path, destination_path, file.size,
-                    files_pbar, bytes_pbar, num_workers, num_retries, chunk_size, max_chunks_number, delay
-                )
-                if not status:
-                    error_files.append(file.path)
-        return error_files
-
     async def _upload_file_multipart(
         self,
         local_connection: AsyncConnector,
-        s3_connection: AsyncConnector,
+        s3_connection: AsyncS3Connector,
         source_path: str,
         destination_path: str,
         file_size: int,
-        files_pbar: tqdm,
-        bytes_pbar: tqdm,
+        files_pbar: '_BatchedProgress',
+        bytes_pbar: '_BatchedProgress',
         num_workers: int = 16,
         num_retries: int = 3,
-        chunk_size: int = 1024 * 1024 * 16,
+        chunk_size: Optional[int] = None,
         max_chunks_number: int = 999,
         delay: int = 3
     ) -> bool:
-        chunks_number = int(math.ceil(file_size / float(chunk_size)))
-        if chunks_number > max_chunks_number:
-            chunk_size = file_size // max_chunks_number + 1
-            chunks_number = int(math.ceil(file_size / float(chunk_size)))
-        retries = 0
-        while retries < num_retries:
-            try:
-                retries += 1
-                async with local_connection.open(source_path, 'rb') as src_file:
-                    if isinstance(s3_connection, AsyncS3Connector):
-                        async with s3_connection.open(destination_path, 'wb', multipart=True) as dst_file:
-                            async with asyncio_pool.AioPool(size=num_workers) as pool:
-                                for part_number in range(1, chunks_number + 1):
-                                    await src_file.seek((part_number - 1) * chunk_size)
-                                    chunk = await src_file.read(chunk_size)
-                                    await pool.spawn(self._upload_chunk(dst_file, chunk, part_number, bytes_pbar))
-                files_pbar.update(1)
-                return True
-            except Exception as err:
-                err_msg = err
-                await asyncio.sleep(delay)
-        print(err_msg)
+        part_size = self._get_part_size(file_size, chunk_size, max_chunks_number, num_workers)
+        progress = _AttemptProgress(bytes_pbar)
+        try:
+            async with local_connection.open(source_path, 'rb') as src_file:
+                async with s3_connection.open(destination_path, 'wb', multipart=True) as dst_file:
+                    # parts held at once: one being read, one queued and num_workers uploading
+                    queue: asyncio.Queue[Optional[tuple[int, bytes]]] = asyncio.Queue(maxsize=1)
+                    tasks = [asyncio.ensure_future(self._read_chunks(src_file, queue, part_size, num_workers))]
+                    tasks += [
+                        asyncio.ensure_future(self._upload_chunks(dst_file, queue, progress, num_retries, delay))
+                        for _ in range(num_workers)
+                    ]
+                    try:
+                        await asyncio.gather(*tasks)
+                    except BaseException:
+                        for task in tasks:
+                            task.cancel()
+                        raise
+        except Exception as err:
+            progress.rollback()
+            print(err)
+            files_pbar.update(1)
+            return False
         files_pbar.update(1)
-        bytes_pbar.update(file_size)
-        return False
+        return True
+
+    @staticmethod
+    async def _read_chunks(
+        src_file: Any,
+        queue: 'asyncio.Queue[Optional[tuple[int, bytes]]]',
+        chunk_size: int,
+        num_workers: int
+    ) -> None:
+        part_number = 1
+        chunk = await src_file.read(chunk_size)
+        while chunk:
+            await queue.put((part_number, chunk))
+            part_number += 1
+            chunk = await src_file.read(chunk_size)
+        for _ in range(num_workers):
+            await queue.put(None)
+
+    async def _upload_chunks(
+        self,
+        dst_file: Any,
+        queue: 'asyncio.Queue[Optional[tuple[int, bytes]]]',
+        progress: '_AttemptProgress',
+        num_retries: int = 3,
+        delay: int = 3
+    ) -> None:
+        while (item := await queue.get()) is not None:
+            part_number, chunk = item
+            await self._upload_chunk(dst_file, chunk, part_number, progress, num_retries, delay)
 
     @staticmethod
     async def _upload_chunk(
-        dst_file: Union[AsyncS3Reader, AsyncMultipartWriter, AsyncSinglepartWriter],
+        dst_file: Any,
         chunk: bytes,
         part_number: int,
-        bytes_pbar: tqdm
+        progress: '_AttemptProgress',
+        num_retries: int = 3,
+        delay: int = 3
     ) -> None:
-        if isinstance(dst_file, AsyncMultipartWriter):
-            await dst_file.write(chunk, part_num=part_number)
-            bytes_pbar.update(len(chunk))
+        for attempt in range(num_retries):
+            try:
+                await dst_file.write(chunk, part_num=part_number)
+                break
+            except Exception as err:
+                if attempt == num_retries - 1 or not _is_retryable(err):
+                    raise
+                await asyncio.sleep(_backoff(delay, attempt))
+        progress.update(len(chunk))
 
     @staticmethod
     async def _download_file(
@@ -294,54 +314,148 @@ class CLI:
         source_path: str,
         destination_path: str,
         file_size: int,
-        files_pbar: tqdm,
-        bytes_pbar: tqdm,
+        files_pbar: '_BatchedProgress',
+        bytes_pbar: '_BatchedProgress',
         chunk_size: int = 1024 * 1024 * 16,
         num_retries: int = 3,
         delay: int = 3
     ) -> bool:
-        retries = 0
+        err_msg: Optional[Exception] = None
         await local_connection.mkdir(os.path.dirname(destination_path))
-        while retries < num_retries:
+        for attempt in range(num_retries):
+            progress = _AttemptProgress(bytes_pbar)
             try:
-                retries += 1
                 async with s3_connection.open(source_path, 'rb') as src_file:
-                    async with local_connection.open(destination_path, 'wb') as dst_file:
-                        chunk = await src_file.read(chunk_size)
-                        while chunk:
-                            await dst_file.write(chunk)
-                            bytes_pbar.update(len(chunk))
-                            chunk = await src_file.read(chunk_size)
+                    await local_connection.write_stream(
+                        destination_path, CLI._count_chunks(src_file.iter_chunks(chunk_size), progress), file_size
+                    )
                 files_pbar.update(1)
                 return True
             except Exception as err:
                 err_msg = err
-                await asyncio.sleep(delay)
+                progress.rollback()
+                if attempt == num_retries - 1 or not _is_retryable(err):
+                    break
+                await asyncio.sleep(_backoff(delay, attempt))
         print(err_msg)
         files_pbar.update(1)
-        bytes_pbar.update(file_size)
         return False
 
+    @staticmethod
+    async def _count_chunks(chunks: AsyncIterable[bytes], progress: '_AttemptProgress') -> AsyncGenerator[bytes, None]:
+        async for chunk in chunks:
+            progress.update(len(chunk))
+            yield chunk
+
+    @staticmethod
+    def _get_part_size(file_size: int, chunk_size: Optional[int], max_chunks_number: int, num_workers: int) -> int:
+        if chunk_size is None:
+            chunk_size = 1 << max(file_size // AUTO_PART_CONCURRENCY - 1, 1).bit_length()
+            max_auto_size = min(MAX_AUTO_PART_SIZE, MAX_AUTO_PART_BUFFER // (num_workers + 2))
+            chunk_size = min(max(chunk_size, MIN_AUTO_PART_SIZE), max(max_auto_size, MIN_AUTO_PART_SIZE))
+        chunk_size = min(chunk_size, MAX_PART_SIZE)
+        if math.ceil(file_size / chunk_size) > min(max_chunks_number, MAX_PARTS_NUMBER):
+            chunk_size = file_size // min(max_chunks_number, MAX_PARTS_NUMBER) + 1
+        return chunk_size
+
     @staticmethod
     def _prepare_paths(s3_path: str, local_path: str) -> tuple[str, str]:
         if platform.system() == 'Windows':
-            local_path = re.sub(r'\\+', '/', local_path)
+            local_path = local_path.replace('\\', '/')
         s3_path = s3_path.split('://')[-1].rstrip('/') + '/'
         local_path = local_path.rstrip('/') + '/'
         return s3_path, local_path
 
-    @staticmethod
-    def _split_small_large_files(
-        files: list[FSEntry],
-        large_file_size: int
-    ) -> tuple[list[FSEntry], list[FSEntry]]:
-        small_files, large_files = [], []
-        for file in files:
-            if file.size is not None and file.size > large_file_size:
-                large_files.append(file)
-            else:
-                small_files.append(file)
-        return small_files, large_files
+
+def _is_retryable(err: Exception) -> bool:
+    if isinstance(err, botocore.exceptions.ClientError):
+        code = err.response.get('Error', {}).get('Code')
+        status = err.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+        return code in RETRYABLE_ERROR_CODES or status >= 500
+    return isinstance(err, (
+        botocore.exceptions.HTTPClientError,
+        botocore.exceptions.ConnectionError,
+        ConnectionError,
+        asyncio.TimeoutError
+    ))
+
+
+def _backoff(delay: float, attempt: int) -> float:
+    return min(MAX_RETRY_DELAY, delay * 2.0 ** attempt + random.random())
+
+
+class _BatchedProgress:
+    """Progress bar redrawn from a background task.
+
+    Updates from transfer coroutines are only summed up and passed
+    to the bar at most once per interval.
+
+    Attributes
+    ----------
+    pbar : tqdm
+        Progress bar.
+    interval : float, default=0.1
+        Refresh interval in seconds.
+    """
+
+    def __init__(self, desc: str, interval: float = 0.1) -> None:
+        self.pbar = tqdm(total=0, desc=desc, mininterval=2 * interval)
+        self.interval = interval
+        self._pending = 0
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def __aenter__(self) -> '_BatchedProgress':
+        self._task = asyncio.ensure_future(self._refresh())
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+        self._flush()
+        self.pbar.close()
+
+    def update(self, n: int) -> None:
+        self._pending += n
+
+    def add_total(self, n: int) -> None:
+        self.pbar.total += n
+
+    def _flush(self) -> None:
+        if self._pending:
+            n, self._pending = self._pending, 0
+            self.pbar.update(n)
+
+    async def _refresh(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self._flush()
+
+
+class _AttemptProgress:
+    """Bytes progress of a single transfer attempt.
+
+    Attributes
+    ----------
+    pbar : _BatchedProgress
+        Bytes progress bar.
+    n : int
+        Bytes counted in this attempt.
+    """
+
+    def __init__(self, pbar: _BatchedProgress) -> None:
+        self.pbar = pbar
+        self.n = 0
+
+    def update(self, n: int) -> None:
+        self.n += n
+        self.pbar.update(n)
+
+    def rollback(self) -> None:
+        if self.n:
+            self.pbar.update(-self.n)
+            self.n = 0
 
 
 async def main() -> None:
@@ -359,19 +473,34 @@ async def main() -> None:
         subparser.add_argument('--local_path', required=True, type=str, help='local folder path')
         subparser.add_argument('--config_path', required=True, type=str, help='path to configuration file')
         subparser.add_argument('--workers', type=int, default=16, help='max workers')
+        subparser.add_argument('--uring', action='store_true', dest='uring',
+                               help='use io_uring for local files (Linux 5.6+ with liburing)')
     upload_parser.add_argument('--multipart', action='store_true', dest='multipart', help='use multipart upload')
+    upload_parser.add_argument('--outer_workers', type=int, default=4,
+                               help='max large files uploaded at once with multipart upload')
+    upload_parser.add_argument('--inner_workers', '--part_concurrent', type=int, default=4, dest='inner_workers',
+                               help='max chunks uploaded at once per file with multipart upload')
+    upload_parser.add_argument('--part_size', type=int, default=None,
+                               help='chunk size in bytes for multipart upload, chosen per file if not set')
     args = parser.parse_args()
 
-    s3_connector = AsyncS3Connector.from_yaml(args.config_path)
-    local_connector = AsyncLocalConnector()
-
-    s3util = CLI(s3_connector, local_connector)
-    if args.action == 'upload':
-        error_files = await s3util.upload(local_path=args.local_path, s3_path=args.s3_path,
-                                          num_workers=args.workers, multipart=args.multipart)
-        print(f'Error files: {error_files}')
-    elif args.action == 'download':
-        error_files = await s3util.download(local_path=args.local_path, s3_path=args.s3_path, num_workers=args.workers)
-        print(f'Error files: {error_files}')
-    else:
-        raise ValueError(f"invalid action: '{args.action}'")
+    pool_size = args.workers
+    if args.action == 'upload' and args.multipart:
+        pool_size = max(pool_size, args.outer_workers * args.inner_workers)
+    s3_connector = AsyncS3Connector.from_yaml(args.config_path, pool_size=pool_size * 2)
+    local_connector = AsyncLocalUringConnector() if args.uring else AsyncLocalConnector()
+
+    async with s3_connector.connect() as sc, local_connector.connect() as lc:
+        s3util = CLI(sc, lc)
+        if args.action == 'upload':
+            error_files = await s3util.upload(local_path=args.local_path, s3_path=args.s3_path,
+                                              num_workers=args.workers, multipart=args.multipart,
+                                              outer_workers=args.outer_workers, inner_workers=args.inner_workers,
+                                              chunk_size=args.part_size)
+            print(f'Error files: {error_files}')
+        elif args.action == 'download':
+            error_files = await s3util.download(local_path=args.local_path, s3_path=args.s3_path,
+                                                num_workers=args.workers)
+            print(f'Error files: {error_files}')
+        else:
+            raise ValueError(f"invalid action: '{args.action}'")
@@ -1,13 +1,22 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from contextlib import AbstractContextManager
 from typing import Any
 
 from fsconnectors.utils.entry import FSEntry
 
+try:
+    import pyarrow
+    _PYARROW = True
+except ImportError:
+    _PYARROW = False
+
 
 class Connector(ABC):
     """Abstract class for connector."""
 
+    __slots__ = ()
+
     @abstractmethod
     def open(self, path: str, mode: str) -> AbstractContextManager[Any]:
         """Open file.
@@ -115,3 +124,66 @@ class Connector(ABC):
             List of directory contents with metadata.
         """
         pass
+
+    def scandir_iter(self, path: str, recursive: bool = False) -> Iterator[FSEntry]:
+        """Iterate over directory entries.
+
+        Yields entries as they are listed, so that callers can start working
+        before the whole directory is scanned.
+
+        Parameters
+        ----------
+        path : str
+            Directory path.
+        recursive : bool, default=False
+            Recursive.
+
+        Yields
+        -------
+        FSEntry
+            Directory entry.
+        """
+        yield from self.scandir(path, recursive)
+
+    def scandir_columnar(self, path: str, recursive: bool = False) -> 'pyarrow.Table':
+        """List directory content with metadata as a columnar table.
+
+        Requires pyarrow (`pip install pyarrow`).
+
+        Parameters
+        ----------
+        path : str
+            Directory path.
+        recursive : bool, default=False
+            Recursive.
+
+        Returns
+        -------
+        pyarrow.Table
+            Table with `name`, `path`, `type`, `size` and `mtime` columns.
+
+        Raises
+        ------
+        ImportError
+            If pyarrow is not installed.
+        """
+        if not _PYARROW:
+            raise ImportError("pyarrow is not installed, install it with 'pip install pyarrow'")
+        names = []
+        paths = []
+        types = []
+        sizes = []
+        mtimes = []
+        for entry in self.scandir_iter(path, recursive):
+            names.append(entry.name)
+            paths.append(entry.path)
+            types.append(entry.type)
+            sizes.append(entry.size)
+            mtimes.append(None if entry.last_modified is None else int(entry.last_modified * 1_000_000))
+        return pyarrow.table({
+            'name': pyarrow.array(names, pyarrow.string()),
+            'path': pyarrow.array(paths, pyarrow.string()),
+            'type': pyarrow.array(types, pyarrow.string()),
+            'size': pyarrow.array(sizes, pyarrow.int64()),
+            'mtime': pyarrow.array(mtimes, pyarrow.timestamp('us'))
+        })
@@ -1,78 +1,220 @@
-import datetime
 import os
 import shutil
-from typing import IO, Any
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import replace
+from typing import IO, Any, Optional
 
 from fsconnectors.connector import Connector
 from fsconnectors.utils.entry import FSEntry
+from fsconnectors.utils.statx import FileType, fast_type
+
+PARALLEL_COPY_MIN_FILES = 32
+SCANDIR_CACHE_SIZE = 128
 
 
 class LocalConnector(Connector):
-    """Local file system connector."""
+    """Local file system connector.
+
+    Attributes
+    ----------
+    max_workers : Optional[int], default=None
+        Max threads used to walk directories recursively. If not set or 1,
+        directories are walked in the calling thread in a stable order.
+    cache_ttl : Optional[float], default=None
+        Seconds to keep scandir and recursive listdir results, disabled if not set.
+        Cached results are also dropped when the directory mtime changes.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, cache_ttl: Optional[float] = None) -> None:
+        self.max_workers = max_workers or 1
+        self.cache_ttl = cache_ttl
+        self._cache: OrderedDict[tuple[str, bool], tuple[float, int, list[FSEntry]]] = OrderedDict()
 
     def open(self, path: str, mode: str = 'r') -> IO[Any]:
         return open(path, mode)
 
     def mkdir(self, path: str) -> None:
-        os.makedirs(path, exist_ok=True)
+        try:
+            os.makedirs(path, exist_ok=True)
+        finally:
+            self._forget(path)
 
     def copy(self, src_path: str, dst_path: str, recursive: bool = False) -> None:
-        if not os.path.exists(src_path):
-            raise FileNotFoundError(f"No such file or directory: '{src_path}'")
-        elif os.path.isdir(src_path) and recursive:
-            shutil.copytree(src_path, dst_path)
-        elif os.path.isfile(src_path):
-            shutil.copyfile(src_path, dst_path)
-        else:
-            raise ValueError(f"'{src_path}' is a directory, but recursive mode is disabled")
+        file_type = self._classify(src_path)
+        try:
+            if file_type == 'dir' and recursive:
+                self._copytree(src_path, dst_path)
+            elif file_type == 'file':
+                shutil.copyfile(src_path, dst_path)
+            else:
+                raise ValueError(f"'{src_path}' is a directory, but recursive mode is disabled")
+        finally:
+            self._forget(dst_path)
 
     def move(self, src_path: str, dst_path: str, recursive: bool = False) -> None:
-        if not os.path.exists(src_path):
-            raise FileNotFoundError(f"No such file or directory: '{src_path}'")
-        elif (os.path.isdir(src_path) and recursive) or os.path.isfile(src_path):
-            os.rename(src_path, dst_path)
-        else:
-            raise ValueError(f"'{src_path}' is a directory, but recursive mode is disabled")
+        file_type = self._classify(src_path)
+        try:
+            if (file_type == 'dir' and recursive) or file_type == 'file':
+                os.rename(src_path, dst_path)
+            else:
+                raise ValueError(f"'{src_path}' is a directory, but recursive mode is disabled")
+        finally:
+            self._forget(src_path, dst_path)
 
     def remove(self, path: str, recursive: bool = False) -> None:
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"No such file or directory: '{path}'")
-        elif os.path.isdir(path) and recursive:
-            shutil.rmtree(path)
-        elif os.path.isfile(path):
-            os.remove(path)
-        else:
-            raise ValueError(f"'{path}' is a directory, but recursive mode is disabled")
+        file_type = self._classify(path)
+        try:
+            if file_type == 'dir' and recursive:
+                shutil.rmtree(path)
+            elif file_type == 'file':
+                os.remove(path)
+            else:
+                raise ValueError(f"'{path}' is a directory, but recursive mode is disabled")
+        finally:
+            self._forget(path)
 
     def listdir(self, path: str, recursive: bool = False) -> list[str]:
-        if recursive:
-            result = []
-            for root, dirs, files in os.walk(path):
-                for name in files:
-                    result.append(os.path.join(root, name))
-                for name in dirs:
-                    result.append(os.path.join(root, name))
-            return result
+        if recursive and self.cache_ttl is not None:
+            return [entry.path for entry in self.scandir(path, recursive)]
+        elif recursive:
+            return [entry.path for entry in self.scandir_iter(path, recursive)]
         else:
             return os.listdir(path)
 
     def scandir(self, path: str, recursive: bool = False) -> list[FSEntry]:
-        result = []
+        if self.cache_ttl is None:
+            return self._scandir(path, recursive)
+        key = (os.path.normpath(path), recursive)
+        mtime = os.stat(path).st_mtime_ns
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and now - cached[0] < self.cache_ttl and cached[1] == mtime:
+            self._cache.move_to_end(key)
+            return [replace(entry) for entry in cached[2]]
+        result = self._scandir(path, recursive)
+        self._cache[key] = (now, mtime, result)
+        self._cache.move_to_end(key)
+        if len(self._cache) > SCANDIR_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        # callers get copies, so changing an entry does not change the cached one
+        return [replace(entry) for entry in result]
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop cached directory listings.
+
+        Parameters
+        ----------
+        path : Optional[str], default=None
+            Directory path. Listings of the directory, its subdirectories and recursive
+            listings of its parents are dropped. All listings are dropped if not set.
+        """
+        if path is None:
+            self._cache.clear()
+            return
+        path = os.path.normpath(path)
+        for cached_path, recursive in list(self._cache):
+            if (cached_path == path
+                    or recursive and path.startswith(cached_path.rstrip(os.sep) + os.sep)
+                    or cached_path.startswith(path.rstrip(os.sep) + os.sep)):
+                del self._cache[(cached_path, recursive)]
+
+    def _forget(self, *paths: str) -> None:
+        # a change does not update the mtime of every cached ancestor,
+        # so listings affected by the connector's own changes are dropped
+        if not self._cache:
+            return
+        for path in paths:
+            self.invalidate(path)
+            self._cache.pop((os.path.dirname(os.path.normpath(path)) or os.curdir, False), None)
+
+    def scandir_iter(self, path: str, recursive: bool = False) -> Iterator[FSEntry]:
+        if not recursive:
+            yield from self.scandir(path)
+            return
+        if self.max_workers == 1:
+            dirs_stack = [path]
+            while dirs_stack:
+                entries, subdirs = _scan_dir(dirs_stack.pop())
+                dirs_stack.extend(subdirs)
+                yield from entries
+            return
+        executor = ThreadPoolExecutor(self.max_workers)
+        dirs = deque([path])
+        running: set[Future[tuple[list[FSEntry], list[str]]]] = set()
+        try:
+            while dirs or running:
+                while dirs and len(running) < self.max_workers * 2:
+                    running.add(executor.submit(_scan_dir, dirs.popleft()))
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    entries, subdirs = future.result()
+                    dirs.extend(subdirs)
+                    yield from entries
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def _scandir(self, path: str, recursive: bool) -> list[FSEntry]:
         if recursive:
-            for root, dirs, files in os.walk(path):
-                for name in dirs:
-                    result.append(FSEntry(name, os.path.join(root, name), 'dir'))
-                for name in files:
-                    path = os.path.join(root, name)
-                    size = os.path.getsize(path)
-                    last_modified = datetime.datetime.fromtimestamp(os.path.getmtime(path))
-                    result.append(FSEntry(name, path, 'file', size, last_modified))
-        else:
-            for entry in os.scandir(path):
+            return list(self.scandir_iter(path, recursive))
+        result = []
+        with os.scandir(path) as it:
+            for entry in it:
                 if entry.is_dir():
                     result.append(FSEntry(entry.name, entry.path, 'dir'))
                 elif entry.is_file():
-                    size = entry.stat().st_size
-                    last_modified = datetime.datetime.fromtimestamp(entry.stat().st_mtime)
-                    result.append(FSEntry(entry.name, entry.path, 'file', size, last_modified))
+                    st = entry.stat()
+                    result.append(FSEntry(entry.name, entry.path, 'file', st.st_size, st.st_mtime))
         return result
+
+    @staticmethod
+    def _classify(path: str) -> FileType:
+        file_type = fast_type(path)
+        if file_type == 'missing':
+            raise FileNotFoundError(f"No such file or directory: '{path}'")
+        return file_type
+
+    def _copytree(self, src_path: str, dst_path: str) -> None:
+        if self.max_workers == 1:
+            shutil.copytree(src_path, dst_path)
+            return
+        dirs = []
+        src_files: list[str] = []
+        dst_files: list[str] = []
+        for root, _, files in os.walk(src_path, onerror=_reraise, followlinks=True):
+            dst_root = os.path.normpath(os.path.join(dst_path, os.path.relpath(root, src_path)))
+            dirs.append((root, dst_root))
+            src_files.extend(os.path.join(root, name) for name in files)
+            dst_files.extend(os.path.join(dst_root, name) for name in files)
+        for _, dst_dir in dirs:
+            os.makedirs(dst_dir)
+        if len(src_files) < PARALLEL_COPY_MIN_FILES:
+            for src_file, dst_file in zip(src_files, dst_files):
+                shutil.copy2(src_file, dst_file)
+        else:
+            with ThreadPoolExecutor(self.max_workers) as executor:
+                for _ in executor.map(shutil.copy2, src_files, dst_files):
+                    pass
+        for src_dir, dst_dir in reversed(dirs):
+            shutil.copystat(src_dir, dst_dir)
+
+
+def _reraise(error: OSError) -> None:
+    raise error
+
+
+def _scan_dir(path: str) -> tuple[list[FSEntry], list[str]]:
+    entries = []
+    subdirs = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir():
+                entries.append(FSEntry(entry.name, entry.path, 'dir'))
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            elif entry.is_file():
+                st = entry.stat()
+                entries.append(FSEntry(entry.name, entry.path, 'file', st.st_size, st.st_mtime))
+    return entries, subdirs
@@ -1,12 +1,28 @@
-from typing import IO, Any, Union
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import IO, Any, Optional, Union
 
 import boto3
-import yaml
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
 
 from fsconnectors.connector import Connector
+from fsconnectors.utils.config import load_config
 from fsconnectors.utils.entry import FSEntry
-from fsconnectors.utils.s3 import MultipartWriter, S3Reader, SinglepartWriter
+from fsconnectors.utils.s3 import (
+    RETRY_MAX_ATTEMPTS,
+    MultipartWriter,
+    S3ParallelReader,
+    S3Reader,
+    S3Writer,
+    SinglepartWriter,
+)
+
+MAX_WORKERS = 64
+MULTIPART_COPY_THRESHOLD = 1024 * 1024 * 100
+TRANSFER_IO_CHUNKSIZE = 1024 * 1024
 
 
 class S3Connector(Connector):
@@ -20,42 +36,70 @@ class S3Connector(Connector):
         AWS access key ID.
     aws_secret_access_key : str
         AWS secret access key.
+    multipart_chunksize : int, default=1024 * 1024 * 16
+        Part size and multipart threshold of managed transfers.
+    max_concurrency : int, default=16
+        Max parts transferred at once by managed transfers.
     """
 
     def __init__(
         self,
         endpoint_url: str,
         aws_access_key_id: str,
-        aws_secret_access_key: str
+        aws_secret_access_key: str,
+        multipart_chunksize: int = 1024 * 1024 * 16,
+        max_concurrency: int = 16
     ):
         self.endpoint_url = endpoint_url
         self.aws_access_key_id = aws_access_key_id
         self.aws_secret_access_key = aws_secret_access_key
+        self.transfer_config = TransferConfig(
+            multipart_threshold=multipart_chunksize,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+            io_chunksize=TRANSFER_IO_CHUNKSIZE,
+            use_threads=True
+        )
+        self.client = boto3.session.Session().client(
+            's3',
+            endpoint_url=self.endpoint_url,
+            aws_access_key_id=self.aws_access_key_id,
+            aws_secret_access_key=self.aws_secret_access_key,
+            config=Config(
+                s3={'addressing_style': 'virtual'},
+                max_pool_connections=MAX_WORKERS,
+                tcp_keepalive=True,
+                retries={'max_attempts': RETRY_MAX_ATTEMPTS, 'mode': 'adaptive'}
+            )
+        )
 
     @classmethod
-    def from_yaml(cls, path: str) -> 'S3Connector':
+    def from_yaml(cls, path: str, **kwargs: Any) -> 'S3Connector':
         """Creates class instance from configuration path.
 
         Parameters
         ----------
         path : str
             path to configuration file.
+        **kwargs : Any
+            Overrides of configuration values, e.g. max_concurrency.
 
         Returns
         -------
         S3Connector
             Class instance.
         """
-        with open(path) as f:
-            config = yaml.safe_load(f)
+        config = load_config(path)
+        config.update(kwargs)
         return cls(**config)
 
     def open(
         self,
         path: str,
         mode: str = 'rb',
-        multipart: bool = False
-    ) -> Union[S3Reader, MultipartWriter, SinglepartWriter]:
+        multipart: Optional[bool] = None,
+        parallel: bool = False
+    ) -> Union[S3Reader, S3ParallelReader, MultipartWriter, SinglepartWriter, S3Writer]:
         """Open file.
 
         Parameters
@@ -64,65 +108,78 @@ class S3Connector(Connector):
             Path to file.
         mode : str
             Open mode.
-        multipart : bool, default=False
-            Use multipart writer.
+        multipart : Optional[bool], default=None
+            Use multipart writer. If not set, the writer starts
+            a multipart upload once data exceeds a single part.
+        parallel : bool, default=False
+            Use parallel ranged reader.
 
         Returns
         -------
-        Union[S3Reader, MultipartWriter, SinglepartWriter]
+        Union[S3Reader, S3ParallelReader, MultipartWriter, SinglepartWriter, S3Writer]
             Readable/writable file-like object.
         """
-        stream: Union[S3Reader, MultipartWriter, SinglepartWriter]
-        client = self._get_client()
+        stream: Union[S3Reader, S3ParallelReader, MultipartWriter, SinglepartWriter, S3Writer]
         bucket, key = self._split_path(path)
         if mode in ['r', 'rb', 'rt']:
-            stream = S3Reader(client, bucket=bucket, key=key, mode=mode)
+            if parallel:
+                stream = S3ParallelReader(self.client, bucket=bucket, key=key, mode=mode)
+            else:
+                stream = S3Reader(self.client, bucket=bucket, key=key, mode=mode)
         elif mode in ['w', 'wb', 'wt']:
-            if multipart:
-                stream = MultipartWriter(client, bucket=bucket, key=key, mode=mode)
+            if multipart is None:
+                stream = S3Writer(self.client, bucket=bucket, key=key, mode=mode)
+            elif multipart:
+                stream = MultipartWriter(self.client, bucket=bucket, key=key, mode=mode)
             else:
-                stream = SinglepartWriter(client, bucket=bucket, key=key, mode=mode)
+                stream = SinglepartWriter(self.client, bucket=bucket, key=key, mode=mode)
         else:
             raise ValueError(f"invalid mode: '{mode}'")
         return stream
 
     def mkdir(self, path: str) -> None:
-        client = self._get_client()
         path = path.rstrip('/') + '/'
         bucket, key = self._split_path(path)
-        client.put_object(Bucket=bucket, Key=key)
-        client.close()
+        self.client.put_object(Bucket=bucket, Key=key)
 
     def copy(self, src_path: str, dst_path: str, recursive: bool = False) -> None:
-        client = self._get_client()
         if recursive:
             src_bucket, src_key = self._split_path(src_path)
             dst_bucket, dst_key = self._split_path(dst_path)
-            paths = self.listdir(src_path, recursive)
-            for path in paths:
-                path_bucket, path_key = self._split_path(path)
-                client.copy({'Bucket': path_bucket, 'Key': path_key}, dst_bucket, path_key.replace(src_key, dst_key))
+            entries = self.scandir_iter(src_path, recursive)
+            bucket_len = len(src_bucket) + 1
+            key_len = len(src_key)
+            with ThreadPoolExecutor(MAX_WORKERS) as executor:
+                futures = [
+                    executor.submit(self._copy_object, src_bucket, entry.path[bucket_len:],
+                                    dst_bucket, dst_key + entry.path[bucket_len + key_len:], entry.size)
+                    for entry in entries
+                ]
+                for future in futures:
+                    future.result()
         else:
             src_bucket, src_key = self._split_path(src_path)
             dst_bucket, dst_key = self._split_path(dst_path)
-            client.copy({'Bucket': src_bucket, 'Key': src_key}, dst_bucket, dst_key)
-        client.close()
+            self.client.copy({'Bucket': src_bucket, 'Key': src_key}, dst_bucket, dst_key, Config=self.transfer_config)
 
     def move(self, src_path: str, dst_path: str, recursive: bool = False) -> None:
         self.copy(src_path, dst_path, recursive)
         self.remove(src_path, recursive)
 
     def remove(self, path: str, recursive: bool = False) -> None:
-        client = self._get_client()
         if recursive:
-            paths = self.listdir(path, recursive)
-            for path in paths:
-                path_bucket, path_key = self._split_path(path)
-                client.delete_object(Bucket=path_bucket, Key=path_key)
+            bucket, _ = self._split_path(path)
+            bucket_len = len(bucket) + 1
+            keys = (entry.path[bucket_len:] for entry in self.scandir_iter(path, recursive))
+            with ThreadPoolExecutor(MAX_WORKERS) as executor:
+                futures = []
+                while batch := list(islice(keys, 1000)):
+                    futures.append(executor.submit(self._delete_objects, bucket, batch))
+                for future in futures:
+                    future.result()
         else:
             bucket, key = self._split_path(path)
-            client.delete_object(Bucket=bucket, Key=key)
-        client.close()
+            self.client.delete_object(Bucket=bucket, Key=key)
 
     def listdir(self, path: str, recursive: bool = False) -> list[str]:
         entries = self.scandir(path, recursive)
@@ -132,38 +189,53 @@ class S3Connector(Connector):
             result = [entry.name for entry in entries]
         return result
 
-    def scandir(self, path: str, recursive: bool = False) -> list[FSEntry]:
-        client = self._get_client()
-        result = []
+    def scandir(self, path: str, recursive: bool = False, parallel: int = 1) -> list[FSEntry]:
+        """Get directory entries.
+
+        Parameters
+        ----------
+        path : str
+            Path to directory.
+        recursive : bool, default=False
+            Scan recursively.
+        parallel : int, default=1
+            Max concurrent listings in recursive mode. If greater than 1, top level
+            subdirectories are listed concurrently.
+
+        Returns
+        -------
+        list[FSEntry]
+            List of directory entries.
+        """
+        if recursive and parallel > 1:
+            top_level = self.scandir(path, recursive=False)
+            result = [entry for entry in top_level if entry.type == 'file']
+            dir_paths = [entry.path for entry in top_level if entry.type == 'dir']
+            with ThreadPoolExecutor(parallel) as executor:
+                for entries in executor.map(partial(self.scandir, recursive=True), dir_paths):
+                    result.extend(entries)
+            return result
+        return list(self.scandir_iter(path, recursive))
+
+    def scandir_iter(self, path: str, recursive: bool = False) -> Iterator[FSEntry]:
         bucket, prefix = self._split_path(path)
-        paginator = client.get_paginator('list_objects')
+        paginator = self.client.get_paginator('list_objects_v2')
         if recursive:
             paginator_result = paginator.paginate(Bucket=bucket, Prefix=prefix, PaginationConfig={'PageSize': 1000})
         else:
             paginator_result = paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter='/',
                                                   PaginationConfig={'PageSize': 1000})
-        for item in paginator_result.search('Contents'):
-            if item:
-                path = bucket + '/' + item.get('Key')
-                name = path.split('/')[-1]
+        for page in paginator_result:
+            for item in page.get('Contents', []):
+                key = item['Key']
+                name = key.rpartition('/')[2]
                 if name:
-                    size = item.get('Size')
-                    last_modified = item.get('LastModified')
-                    result.append(FSEntry(name, path, 'file', size, last_modified))
-        paginator = client.get_paginator('list_objects')
-        if recursive:
-            paginator_result = paginator.paginate(Bucket=bucket, Prefix=prefix, PaginationConfig={'PageSize': 1000})
-        else:
-            paginator_result = paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter='/',
-                                                  PaginationConfig={'PageSize': 1000})
-        for item in paginator_result.search('CommonPrefixes'):
-            if item:
-                path = bucket + '/' + item.get('Prefix')
-                name = path.split('/')[-2]
+                    yield FSEntry(name, f'{bucket}/{key}', 'file', item['Size'], item['LastModified'].timestamp())
+            for item in page.get('CommonPrefixes', []):
+                dir_prefix = item['Prefix']
+                name = dir_prefix[:-1].rpartition('/')[2]
                 if name:
-                    result.append(FSEntry(name, path, 'dir'))
-        client.close()
-        return result
+                    yield FSEntry(name, f'{bucket}/{dir_prefix}', 'dir')
 
     def upload_fileobj(
         self,
@@ -179,24 +251,45 @@ class S3Connector(Connector):
         dst_path : str
             Destination path.
         """
-        client = self._get_client()
         bucket, key = self._split_path(dst_path)
-        client.upload_fileobj(fileobj, bucket, key)
+        self.client.upload_fileobj(fileobj, bucket, key, Config=self.transfer_config)
 
-    def _get_client(self) -> Any:
-        client = boto3.session.Session().client(
-            's3',
-            endpoint_url=self.endpoint_url,
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key,
-            config=Config(s3={'addressing_style': 'virtual'})
+    def download_fileobj(
+        self,
+        src_path: str,
+        fileobj: IO[Any]
+    ) -> None:
+        """Download file object
+
+        Parameters
+        ----------
+        src_path : str
+            Source path.
+        fileobj : IO[Any]
+            Binary file object to write to.
+        """
+        bucket, key = self._split_path(src_path)
+        self.client.download_fileobj(bucket, key, fileobj, Config=self.transfer_config)
+
+    def _copy_object(self, src_bucket: str, src_key: str, dst_bucket: str, dst_key: str,
+                     size: Optional[int]) -> None:
+        if size is not None and size < MULTIPART_COPY_THRESHOLD:
+            self.client.copy_object(CopySource={'Bucket': src_bucket, 'Key': src_key}, Bucket=dst_bucket, Key=dst_key)
+        else:
+            self.client.copy({'Bucket': src_bucket, 'Key': src_key}, dst_bucket, dst_key, Config=self.transfer_config)
+
+    def _delete_objects(self, bucket: str, keys: list[str]) -> None:
+        resp = self.client.delete_objects(
+            Bucket=bucket,
+            Delete={'Objects': [{'Key': key} for key in keys], 'Quiet': True}
         )
-        return client
+        errors = resp.get('Errors', [])
+        if errors:
+            raise RuntimeError(f"Failed to delete {len(errors)} objects from '{bucket}', "
+                               f"'{errors[0]['Key']}': {errors[0]['Message']}")
 
     @staticmethod
-    def _split_path(path: str) -> list[str]:
-        path = path.split('://')[-1]
-        parts = path.split('/', maxsplit=1)
-        if len(parts) == 1:
-            parts.append('')
-        return parts
+    def _split_path(path: str) -> tuple[str, str]:
+        head, sep, tail = path.partition('://')
+        bucket, _, key = (tail if sep else head).partition('/')
+        return bucket, key
@@ -0,0 +1,36 @@
+import os
+from functools import lru_cache
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+def load_config(path: str) -> dict[str, Any]:
+    """Load yaml configuration file.
+
+    Uses the libyaml based loader when PyYAML is built with it.
+    Parsed files are cached until their modification time changes.
+
+    Parameters
+    ----------
+    path : str
+        Path to configuration file.
+
+    Returns
+    -------
+    dict[str, Any]
+        Configuration.
+    """
+    return dict(_load_config(os.path.abspath(path), os.stat(path).st_mtime_ns))
+
+
+@lru_cache(maxsize=32)
+def _load_config(path: str, mtime_ns: int) -> dict[str, Any]:
+    with open(path) as f:
+        config: dict[str, Any] = yaml.load(f, Loader=_Loader)
+    return config
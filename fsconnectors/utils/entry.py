@@ -1,12 +1,22 @@
 import datetime
+import sys
 from dataclasses import dataclass
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 
+_DATACLASS_KWARGS: dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_KWARGS)
 class FSEntry:
     name: str
     path: str
     type: Literal['file', 'dir']
     size: Optional[int] = None
-    last_modified: Optional[datetime.datetime] = None
+    last_modified: Optional[float] = None
+
+    @property
+    def last_modified_dt(self) -> Optional[datetime.datetime]:
+        """Last modified time as local datetime."""
+        if self.last_modified is None:
+            return None
+        return datetime.datetime.fromtimestamp(self.last_modified)
@@ -0,0 +1,56 @@
+import asyncio
+from collections.abc import Coroutine
+from contextlib import AbstractAsyncContextManager
+from typing import Any, TypeVar
+
+T = TypeVar('T')
+
+
+class TaskPool(AbstractAsyncContextManager[Any]):
+    """Bounded pool of asyncio tasks.
+
+    Waits for all spawned tasks on exit, cancels them if the block raised.
+
+    Attributes
+    ----------
+    size : int
+        Max concurrently running tasks.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._sem = asyncio.Semaphore(size)
+        self._tasks: set[asyncio.Task[Any]] = set()
+
+    async def __aenter__(self) -> 'TaskPool':
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if exc_type is not None:
+            for task in self._tasks:
+                task.cancel()
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def spawn(self, coro: Coroutine[Any, Any, T]) -> 'asyncio.Task[T]':
+        """Wait for a free slot and run coroutine as a task.
+
+        Parameters
+        ----------
+        coro : Coroutine[Any, Any, T]
+            Coroutine to run.
+
+        Returns
+        -------
+        asyncio.Task[T]
+            Running task.
+        """
+        await self._sem.acquire()
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_done)
+        return task
+
+    def _on_done(self, task: 'asyncio.Task[Any]') -> None:
+        self._tasks.discard(task)
+        self._sem.release()
@@ -1,23 +1,30 @@
+import asyncio
+import codecs
 import tempfile
-from contextlib import AbstractAsyncContextManager, AbstractContextManager
+import weakref
+from collections.abc import AsyncGenerator, AsyncIterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractAsyncContextManager, AbstractContextManager, suppress
 from typing import Any, Optional, Union
 
-import asynctempfile
+MAX_PART_NUMBER = 10000
+SPOOL_MAX_SIZE = 1024 * 1024 * 64
+MIN_PART_SIZE = 1024 * 1024 * 5
+DEFAULT_PART_SIZE = 1024 * 1024 * 8
+RETRY_MAX_ATTEMPTS = 10  # adaptive retries of the sync and async S3 clients
 
+_BytesLike = Union[bytes, bytearray, memoryview]
+_BYTES_TYPES = (bytes, bytearray, memoryview)
 
-class MultipartWriter(AbstractContextManager[Any]):
-    """Multipart S3 writer.
 
-    Attributes
-    ----------
-    client : Any
-        Boto3 S3 client.
-    bucket : str
-        S3 bucket.
-    key : str
-        S3 file key.
-    mode : str = 'wb'
-        Write mode.
+class _MultipartBase:
+    """State and bookkeeping shared by the multipart writers.
+
+    Writes without explicit part_num are buffered and uploaded in parts of
+    part_size bytes, the rest is uploaded as the last part on exit. Writes
+    with explicit part_num are uploaded as is. ETags of uploaded parts are
+    kept by the writer itself, so completing the upload does not need
+    a list_parts call.
     """
 
     def __init__(
@@ -25,73 +32,136 @@ class MultipartWriter(AbstractContextManager[Any]):
         client: Any,
         bucket: str,
         key: str,
-        mode: str = 'wb'
+        mode: str = 'wb',
+        part_size: int = DEFAULT_PART_SIZE
     ):
         assert mode in ['wb', 'w', 'wt'], f"invalid mode: '{mode}'"
+        assert part_size >= MIN_PART_SIZE, f'part_size must be at least {MIN_PART_SIZE} bytes'
         self.client = client
         self.bucket = bucket
         self.key = key
         self.mode = mode
+        self.part_size = part_size
+        self._data_type = _BYTES_TYPES if mode == 'wb' else str
         self._upload_id = ''
         self._part_num = 0
-        self._part_info: dict[Any, Any] = {'Parts': []}
+        self._buffer = bytearray()
+        self._finalizer: Optional[weakref.finalize[Any, Any]] = None
+        self.completed_parts: dict[int, str] = {}
+
+    def _as_bytes(self, data: Union[str, _BytesLike]) -> _BytesLike:
+        if not isinstance(data, self._data_type):
+            raise ValueError(f"invalid data type for mode '{self.mode}'")
+        if isinstance(data, str):
+            return data.encode('utf-8')
+        return data
+
+    def _body(self, data: Union[str, _BytesLike]) -> Union[bytes, bytearray]:
+        body = self._as_bytes(data)
+        if isinstance(body, memoryview):
+            return bytes(body)  # botocore does not accept memoryview bodies
+        return body
+
+    def _next_part_num(self, part_num: Optional[int] = None) -> int:
+        if part_num is None:
+            part_num = self._part_num + 1
+        if not 1 <= part_num <= MAX_PART_NUMBER:
+            raise ValueError(f'part_num must be an integer between 1 and {MAX_PART_NUMBER}')
+        self._part_num = max(self._part_num, part_num)
+        return part_num
+
+    def _full_parts(self, data: _BytesLike) -> list[bytearray]:
+        self._buffer += data
+        parts = []
+        while len(self._buffer) >= self.part_size:
+            parts.append(self._buffer[:self.part_size])
+            del self._buffer[:self.part_size]
+        return parts
+
+    def _last_part(self) -> bytearray:
+        data, self._buffer = self._buffer, bytearray()
+        return data
+
+    def _detach(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer.detach()
+
+    def _multipart_upload(self) -> dict[str, Any]:
+        return {
+            'Parts': [
+                {'PartNumber': part_num, 'ETag': etag}
+                for part_num, etag in sorted(self.completed_parts.items())
+            ]
+        }
+
+
+class MultipartWriter(_MultipartBase, AbstractContextManager[Any]):
+    """Multipart S3 writer.
+
+    Attributes
+    ----------
+    client : Any
+        Boto3 S3 client.
+    bucket : str
+        S3 bucket.
+    key : str
+        S3 file key.
+    mode : str = 'wb'
+        Write mode.
+    part_size : int, default=8388608
+        Size of buffered parts in bytes.
+    """
 
     def __enter__(self) -> 'MultipartWriter':
         resp = self.client.create_multipart_upload(Bucket=self.bucket, Key=self.key)
         self._upload_id = resp['UploadId']
+        self._finalizer = weakref.finalize(self, _abort_upload, self.client, self.bucket, self.key, self._upload_id)
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        resp = self.client.list_parts(
-            Bucket=self.bucket,
-            Key=self.key,
-            UploadId=self._upload_id
-        )
-        uploaded_parts = resp['Parts']
-        if len(uploaded_parts) == self._part_num:
-            parts_sorted = sorted(self._part_info['Parts'], key=lambda x: x['PartNumber'])
-            self._part_info['Parts'] = parts_sorted
-            self.client.complete_multipart_upload(
-                Bucket=self.bucket,
-                Key=self.key,
-                UploadId=self._upload_id,
-                MultipartUpload=self._part_info
-            )
-        else:
-            loss = int((self._part_num - len(uploaded_parts)) / self._part_num * 100)
+        error: Optional[Exception] = None
+        if exc_type is None and self._buffer:
+            try:
+                self._upload_part(self._next_part_num(), self._last_part())
+            except Exception as e:
+                error = e
+        if exc_type is not None or error is not None or not self.completed_parts:
+            self._detach()
             self.client.abort_multipart_upload(
                 Bucket=self.bucket,
                 Key=self.key,
                 UploadId=self._upload_id
             )
-            raise RuntimeError(f'Write aborted!\n'
-                               f'{self._part_num} parts transmitted, {len(uploaded_parts)} received, {loss}% loss')
+            if exc_type is None:
+                raise error or RuntimeError('Write aborted!\nno parts transmitted')
+            return
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            MultipartUpload=self._multipart_upload()
+        )
+        self._detach()
 
-    def write(self, data: Any, part_num: Optional[int] = None) -> None:
-        if ((self.mode == 'wb' and not isinstance(data, bytes))
-                or (self.mode in ['w', 'wt'] and not isinstance(data, str))):
-            raise ValueError(f"invalid data type for mode '{self.mode}'")
-        if part_num is None:
-            part_num = self._part_num = self._part_num + 1
-        elif 1 <= part_num <= 10000:
-            self._part_num += 1
-        else:
-            raise ValueError('part_num must be an integer between 1 and 1000')
-        if self.mode != 'wb':
-            data = data.encode('utf-8')
-        resp = self.client.upload_part(Bucket=self.bucket, Body=data,
+    def write(self, data: Union[str, _BytesLike], part_num: Optional[int] = None) -> None:
+        if part_num is not None:
+            self._upload_part(self._next_part_num(part_num), self._body(data))
+            return
+        for part in self._full_parts(self._as_bytes(data)):
+            self._upload_part(self._next_part_num(), part)
+
+    def _upload_part(self, part_num: int, body: Union[bytes, bytearray]) -> None:
+        resp = self.client.upload_part(Bucket=self.bucket, Body=body,
                                        UploadId=self._upload_id, PartNumber=part_num, Key=self.key)
-        self._part_info['Parts'].append(
-            {
-                'PartNumber': part_num,
-                'ETag': resp['ETag']
-            }
-        )
+        self.completed_parts[part_num] = resp['ETag']
 
 
-class AsyncMultipartWriter(AbstractAsyncContextManager[Any]):
+class AsyncMultipartWriter(_MultipartBase, AbstractAsyncContextManager[Any]):
     """Async multipart S3 writer.
 
+    With concurrency above 1, write returns as soon as the part upload is
+    started, and part upload errors are raised by the next write or on exit.
+
     Attributes
     ----------
     client : Any
@@ -102,6 +172,10 @@ class AsyncMultipartWriter(AbstractAsyncContextManager[Any]):
         S3 file key.
     mode : str = 'wb'
         Write mode.
+    part_size : int, default=8388608
+        Size of buffered parts in bytes.
+    concurrency : int, default=1
+        Max parts uploaded at once.
     """
 
     def __init__(
@@ -109,73 +183,144 @@ class AsyncMultipartWriter(AbstractAsyncContextManager[Any]):
         client: Any,
         bucket: str,
         key: str,
-        mode: str = 'wb'
+        mode: str = 'wb',
+        part_size: int = DEFAULT_PART_SIZE,
+        concurrency: int = 1
     ):
-        assert mode in ['wb', 'w', 'wt'], f"invalid mode: '{mode}'"
-        self.client = client
-        self.bucket = bucket
-        self.key = key
-        self.mode = mode
-        self._upload_id = ''
-        self._part_num: int = 0
-        self._part_info: dict[Any, Any] = {'Parts': []}
+        super().__init__(client, bucket, key, mode, part_size)
+        self.concurrency = concurrency
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._pending: set[asyncio.Task[None]] = set()
+        self._error: Optional[BaseException] = None
+        self._create_task: Optional[asyncio.Future[Any]] = None
 
     async def __aenter__(self) -> 'AsyncMultipartWriter':
-        resp = await self.client.create_multipart_upload(Bucket=self.bucket, Key=self.key)
-        self._upload_id = resp['UploadId']
+        self._create_task = asyncio.ensure_future(
+            self.client.create_multipart_upload(Bucket=self.bucket, Key=self.key)
+        )
+        self._create_task.add_done_callback(self._created)
+        if self.concurrency > 1:
+            self._sem = asyncio.Semaphore(self.concurrency)
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        resp = await self.client.list_parts(
+        if exc_type is None and self._buffer and self._error is None:
+            try:
+                await self._send_part(self._next_part_num(), self._last_part())
+            except Exception as e:
+                self._error = e
+        if self._pending:
+            if exc_type is not None:
+                for task in self._pending:
+                    task.cancel()
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        if exc_type is not None or self._error is not None or not self.completed_parts:
+            await self._abort()
+            if exc_type is None:
+                raise self._error or RuntimeError('Write aborted!\nno parts transmitted')
+            return
+        await self.client.complete_multipart_upload(
             Bucket=self.bucket,
             Key=self.key,
-            UploadId=self._upload_id
+            UploadId=await self._get_upload_id(),
+            MultipartUpload=self._multipart_upload()
         )
-        uploaded_parts = resp['Parts']
-        if len(uploaded_parts) == self._part_num:
-            parts_sorted = sorted(self._part_info['Parts'], key=lambda x: x['PartNumber'])
-            self._part_info['Parts'] = parts_sorted
-            await self.client.complete_multipart_upload(
-                Bucket=self.bucket,
-                Key=self.key,
-                UploadId=self._upload_id,
-                MultipartUpload=self._part_info
-            )
-        else:
-            loss = int((self._part_num - len(uploaded_parts)) / self._part_num * 100)
-            await self.client.abort_multipart_upload(
-                Bucket=self.bucket,
-                Key=self.key,
-                UploadId=self._upload_id
-            )
-            raise RuntimeError(f'Write aborted!\n'
-                               f'{self._part_num} parts transmitted, {len(uploaded_parts)} received, {loss}% loss')
-
-    async def write(self, data: Any, part_num: Optional[int] = None) -> None:
-        if ((self.mode == 'wb' and not isinstance(data, bytes))
-                or (self.mode in ['w', 'wt'] and not isinstance(data, str))):
-            raise ValueError(f"invalid data type for mode '{self.mode}'")
-        if part_num is None:
-            part_num = self._part_num = self._part_num + 1
-        elif 1 <= part_num <= 10000:
-            self._part_num += 1
-        else:
-            raise ValueError('part_num must be an integer between 1 and 1000')
-        if self.mode != 'wb':
-            data = data.encode('utf-8')
-        resp = await self.client.upload_part(Bucket=self.bucket, Body=data,
-                                             UploadId=self._upload_id, PartNumber=part_num, Key=self.key)
-        self._part_info['Parts'].append(
-            {
-                'PartNumber': part_num,
-                'ETag': resp['ETag']
-            }
+        self._detach()
+
+    async def write(self, data: Union[str, _BytesLike], part_num: Optional[int] = None) -> None:
+        if part_num is not None:
+            await self._send_part(self._next_part_num(part_num), self._body(data))
+            return
+        for part in self._full_parts(self._as_bytes(data)):
+            await self._send_part(self._next_part_num(), part)
+
+    async def write_iter(self, chunks: AsyncIterable[Union[str, _BytesLike]]) -> None:
+        """Write chunks from async iterable.
+
+        With concurrency above 1, up to concurrency parts are uploaded
+        while next chunks are produced.
+
+        Parameters
+        ----------
+        chunks : AsyncIterable[Union[str, bytes, bytearray, memoryview]]
+            Data chunks of any size.
+        """
+        async for chunk in chunks:
+            await self.write(chunk)
+
+    async def _send_part(self, part_num: int, body: Union[bytes, bytearray]) -> None:
+        if self._sem is None:
+            await self._upload_part(part_num, body)
+            return
+        if self._error is not None:
+            raise self._error
+        await self._sem.acquire()
+        task = asyncio.ensure_future(self._upload_part(part_num, body))
+        self._pending.add(task)
+        task.add_done_callback(self._part_done)
+
+    async def _upload_part(self, part_num: int, body: Union[bytes, bytearray]) -> None:
+        upload_id = await self._get_upload_id()
+        resp = await self.client.upload_part(Bucket=self.bucket, Body=body,
+                                             UploadId=upload_id, PartNumber=part_num, Key=self.key)
+        self.completed_parts[part_num] = resp['ETag']
+
+    async def _get_upload_id(self) -> str:
+        if not self._upload_id:
+            assert self._create_task is not None, 'writer is not entered'
+            await asyncio.shield(self._create_task)
+            self._created(self._create_task)
+        return self._upload_id
+
+    def _created(self, task: 'asyncio.Future[Any]') -> None:
+        if self._upload_id or task.cancelled() or task.exception() is not None:
+            return
+        self._upload_id = task.result()['UploadId']
+        self._finalizer = weakref.finalize(self, _abort_upload_soon, task.get_loop(),
+                                           self.client, self.bucket, self.key, self._upload_id)
+
+    async def _abort(self) -> None:
+        try:
+            upload_id = await self._get_upload_id()
+        except Exception:
+            return  # upload was not created, nothing to abort
+        self._detach()
+        await self.client.abort_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=upload_id
         )
 
+    def _part_done(self, task: 'asyncio.Task[None]') -> None:
+        self._pending.discard(task)
+        if self._sem is not None:
+            self._sem.release()
+        if not task.cancelled() and task.exception() is not None and self._error is None:
+            self._error = task.exception()
+
+
+def _abort_upload(client: Any, bucket: str, key: str, upload_id: str) -> None:
+    with suppress(Exception):
+        client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+
+
+def _abort_upload_soon(loop: asyncio.AbstractEventLoop, client: Any, bucket: str, key: str, upload_id: str) -> None:
+    if not loop.is_running():
+        return  # nothing can be awaited without the loop
+
+    async def abort() -> None:
+        with suppress(Exception):
+            await client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+
+    asyncio.run_coroutine_threadsafe(abort(), loop)
+
 
 class SinglepartWriter(AbstractContextManager[Any]):
     """Singlepart S3 writer.
 
+    Data is buffered in memory and spilled to a temporary file
+    once it exceeds SPOOL_MAX_SIZE.
+
     Attributes
     ----------
     client : Any
@@ -202,24 +347,30 @@ class SinglepartWriter(AbstractContextManager[Any]):
         self.mode = mode
 
     def __enter__(self) -> 'SinglepartWriter':
-        self.file = tempfile.NamedTemporaryFile(f'{self.mode}+')
+        self.file = tempfile.SpooledTemporaryFile(SPOOL_MAX_SIZE, 'wb+')
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        self.file.seek(0)
-        data = self.file.read()
-        if self.mode != 'wb':
-            data = data.encode('utf-8')
-        self.client.put_object(Body=data, Bucket=self.bucket, Key=self.key)
-        self.file.close()
+        try:
+            if exc_type is None:
+                self.file.seek(0)
+                self.client.put_object(Body=self.file, Bucket=self.bucket, Key=self.key)
+        finally:
+            self.file.close()
 
     def write(self, data: Union[str, bytes]) -> None:
+        if isinstance(data, str):
+            data = data.encode('utf-8')
         self.file.write(data)
 
 
 class AsyncSinglepartWriter(AbstractAsyncContextManager[Any]):
     """Async singlepart S3 writer.
 
+    Data is buffered in memory and sent with a single put_object. Once it
+    exceeds SPOOL_MAX_SIZE, it is spilled to a temporary file, which is
+    streamed with upload_fileobj on exit.
+
     Attributes
     ----------
     client : Any
@@ -246,19 +397,162 @@ class AsyncSinglepartWriter(AbstractAsyncContextManager[Any]):
         self.mode = mode
 
     async def __aenter__(self) -> 'AsyncSinglepartWriter':
-        self.file = await asynctempfile.NamedTemporaryFile(f'{self.mode}+')
+        self.file = tempfile.SpooledTemporaryFile(SPOOL_MAX_SIZE, 'wb+')
+        self._size = 0
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        await self.file.seek(0)
-        data = await self.file.read()
-        if self.mode != 'wb':
-            data = data.encode('utf-8')
-        await self.client.put_object(Body=data, Bucket=self.bucket, Key=self.key)
-        await self.file.close()
+        try:
+            if exc_type is None:
+                self.file.seek(0)
+                if self._size <= SPOOL_MAX_SIZE:
+                    await self.client.put_object(Body=self.file.read(), Bucket=self.bucket, Key=self.key)
+                else:
+                    await self.client.upload_fileobj(self.file, self.bucket, self.key)
+        finally:
+            self.file.close()
 
     async def write(self, data: Union[str, bytes]) -> None:
-        await self.file.write(data)
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        self._size += memoryview(data).nbytes
+        if self._size > SPOOL_MAX_SIZE:
+            await asyncio.to_thread(self.file.write, data)
+        else:
+            self.file.write(data)
+
+
+class S3Writer(AbstractContextManager[Any]):
+    """S3 writer switching from single to multipart upload.
+
+    Data is buffered, and an object smaller than part_size is uploaded with
+    a single put_object. Once the buffer reaches part_size, a multipart
+    upload is started and the data is written in parts.
+
+    Attributes
+    ----------
+    client : Any
+        Boto3 S3 client.
+    bucket : str
+        S3 bucket.
+    key : str
+        S3 file key.
+    mode : str = 'wb'
+        Write mode.
+    part_size : int, default=8388608
+        Size of multipart upload parts in bytes.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        bucket: str,
+        key: str,
+        mode: str = 'wb',
+        part_size: int = DEFAULT_PART_SIZE
+    ):
+        assert mode in ['wb', 'w', 'wt'], f"invalid mode: '{mode}'"
+        assert part_size >= MIN_PART_SIZE, f'part_size must be at least {MIN_PART_SIZE} bytes'
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.mode = mode
+        self.part_size = part_size
+        self._data_type = _BYTES_TYPES if mode == 'wb' else str
+        self._buffer = bytearray()
+        self._multipart: Optional[MultipartWriter] = None
+
+    def __enter__(self) -> 'S3Writer':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if self._multipart is not None:
+            self._multipart.__exit__(exc_type, exc_val, exc_tb)
+        elif exc_type is None:
+            self.client.put_object(Body=self._buffer, Bucket=self.bucket, Key=self.key)
+
+    def write(self, data: Union[str, _BytesLike]) -> None:
+        if not isinstance(data, self._data_type):
+            raise ValueError(f"invalid data type for mode '{self.mode}'")
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if self._multipart is None:
+            self._buffer += data
+            if len(self._buffer) < self.part_size:
+                return
+            data, self._buffer = self._buffer, bytearray()
+            self._multipart = MultipartWriter(self.client, self.bucket, self.key, 'wb', self.part_size)
+            self._multipart.__enter__()
+        self._multipart.write(data)
+
+
+class AsyncS3Writer(AbstractAsyncContextManager[Any]):
+    """Async S3 writer switching from single to multipart upload.
+
+    Data is buffered, and an object smaller than part_size is uploaded with
+    a single put_object. Once the buffer reaches part_size, a multipart
+    upload is started and the data is written in parts.
+
+    Attributes
+    ----------
+    client : Any
+        Aioboto3 S3 client.
+    bucket : str
+        S3 bucket.
+    key : str
+        S3 file key.
+    mode : str = 'wb'
+        Write mode.
+    part_size : int, default=8388608
+        Size of multipart upload parts in bytes.
+    concurrency : int, default=1
+        Max parts uploaded at once.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        bucket: str,
+        key: str,
+        mode: str = 'wb',
+        part_size: int = DEFAULT_PART_SIZE,
+        concurrency: int = 1
+    ):
+        assert mode in ['wb', 'w', 'wt'], f"invalid mode: '{mode}'"
+        assert part_size >= MIN_PART_SIZE, f'part_size must be at least {MIN_PART_SIZE} bytes'
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.mode = mode
+        self.part_size = part_size
+        self.concurrency = concurrency
+        self._data_type = _BYTES_TYPES if mode == 'wb' else str
+        self._buffer = bytearray()
+        self._multipart: Optional[AsyncMultipartWriter] = None
+
+    async def __aenter__(self) -> 'AsyncS3Writer':
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if self._multipart is not None:
+            await self._multipart.__aexit__(exc_type, exc_val, exc_tb)
+        elif exc_type is None:
+            await self.client.put_object(Body=self._buffer, Bucket=self.bucket, Key=self.key)
+
+    async def write(self, data: Union[str, _BytesLike]) -> None:
+        if not isinstance(data, self._data_type):
+            raise ValueError(f"invalid data type for mode '{self.mode}'")
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if self._multipart is None:
+            self._buffer += data
+            if len(self._buffer) < self.part_size:
+                return
+            data, self._buffer = self._buffer, bytearray()
+            self._multipart = AsyncMultipartWriter(self.client, self.bucket, self.key, 'wb',
+                                                   self.part_size, self.concurrency)
+            await self._multipart.__aenter__()
+        await self._multipart.write(data)
 
 
 class S3Reader(AbstractContextManager[Any]):
@@ -304,6 +598,76 @@ class S3Reader(AbstractContextManager[Any]):
         return data
 
 
+class S3ParallelReader(AbstractContextManager[Any]):
+    """S3 reader with parallel ranged requests.
+
+    Attributes
+    ----------
+    client : Any
+        Boto3 S3 client.
+    bucket : str
+        S3 bucket.
+    key : str
+        S3 file key.
+    mode : str = 'rb'
+        Read mode.
+    part_size : int, default=8388608
+        Size of a single ranged request in bytes.
+    concurrency : int, default=8
+        Max concurrent ranged requests.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        bucket: str,
+        key: str,
+        mode: str = 'rb',
+        part_size: int = 8 << 20,
+        concurrency: int = 8
+    ):
+        assert mode in ['rb', 'r', 'rt'], f"invalid mode: '{mode}'"
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.mode = mode
+        self.part_size = part_size
+        self.concurrency = concurrency
+        self.size = 0
+        self.position = 0
+
+    def __enter__(self) -> 'S3ParallelReader':
+        obj = self.client.head_object(Bucket=self.bucket, Key=self.key)
+        self.size = obj['ContentLength']
+        self.etag = obj['ETag']
+        self._executor = ThreadPoolExecutor(self.concurrency)
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self._executor.shutdown()
+
+    def read(self, chunk: Optional[int] = None) -> Any:
+        start = self.position
+        end = self.size if chunk is None else min(self.size, start + chunk)
+        buffer = bytearray(max(end - start, 0))
+
+        def read_part(offset: int) -> None:
+            last = min(offset + self.part_size, end) - 1
+            obj = self.client.get_object(
+                Bucket=self.bucket, Key=self.key, Range=f'bytes={offset}-{last}', IfMatch=self.etag
+            )
+            data = obj['Body'].read()
+            _check_range(self.key, offset, last, data)
+            buffer[offset - start:offset - start + len(data)] = data
+
+        for _ in self._executor.map(read_part, range(start, end, self.part_size)):
+            pass
+        self.position = max(end, start)
+        if self.mode != 'rb':
+            return buffer.decode('utf-8')
+        return bytes(buffer)
+
+
 class AsyncS3Reader(AbstractAsyncContextManager[Any]):
     """Async S3 stream reader.
 
@@ -345,3 +709,100 @@ class AsyncS3Reader(AbstractAsyncContextManager[Any]):
         if self.mode != 'rb':
             data = data.decode('utf-8')
         return data
+
+    async def iter_chunks(self, chunk_size: int = 1024 * 128) -> AsyncGenerator[Any, None]:
+        """Iterate over file chunks.
+
+        Parameters
+        ----------
+        chunk_size : int, default=1024 * 128
+            Chunk size in bytes.
+
+        Yields
+        -------
+        Any
+            File chunk.
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')() if self.mode != 'rb' else None
+        async for chunk in self.stream.iter_chunks(chunk_size):
+            yield decoder.decode(chunk) if decoder is not None else chunk
+        if decoder is not None:
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                yield tail
+
+
+class AsyncS3ParallelReader(AbstractAsyncContextManager[Any]):
+    """Async S3 reader with parallel ranged requests.
+
+    Attributes
+    ----------
+    client : Any
+        Boto3 S3 client.
+    bucket : str
+        S3 bucket.
+    key : str
+        S3 file key.
+    mode : str = 'rb'
+        Read mode.
+    part_size : int, default=8388608
+        Size of a single ranged request in bytes.
+    concurrency : int, default=8
+        Max concurrent ranged requests.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        bucket: str,
+        key: str,
+        mode: str = 'rb',
+        part_size: int = 8 << 20,
+        concurrency: int = 8
+    ):
+        assert mode in ['rb', 'r', 'rt'], f"invalid mode: '{mode}'"
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.mode = mode
+        self.part_size = part_size
+        self.concurrency = concurrency
+        self.size = 0
+        self.position = 0
+
+    async def __aenter__(self) -> 'AsyncS3ParallelReader':
+        obj = await self.client.head_object(Bucket=self.bucket, Key=self.key)
+        self.size = obj['ContentLength']
+        self.etag = obj['ETag']
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        pass
+
+    async def read(self, chunk: Optional[int] = None) -> Any:
+        start = self.position
+        end = self.size if chunk is None else min(self.size, start + chunk)
+        buffer = bytearray(max(end - start, 0))
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def read_part(offset: int) -> None:
+            last = min(offset + self.part_size, end) - 1
+            async with sem:
+                obj = await self.client.get_object(
+                    Bucket=self.bucket, Key=self.key, Range=f'bytes={offset}-{last}', IfMatch=self.etag
+                )
+                async with obj['Body'] as stream:
+                    data = await stream.read()
+            _check_range(self.key, offset, last, data)
+            buffer[offset - start:offset - start + len(data)] = data
+
+        await asyncio.gather(*[read_part(offset) for offset in range(start, end, self.part_size)])
+        self.position = max(end, start)
+        if self.mode != 'rb':
+            return buffer.decode('utf-8')
+        return bytes(buffer)
+
+
+def _check_range(key: str, offset: int, last: int, data: bytes) -> None:
+    if len(data) != last - offset + 1:
+        raise OSError(f"short read of '{key}' bytes={offset}-{last}: got {len(data)} bytes")